@@ -27,9 +27,11 @@ _FUNC_TEMPLATE = textwrap.dedent(
 def _generate_fixture(target_lines: int = 1000) -> tuple[str, str]:
     """Return (source_code, target_name) fixture with about *target_lines* lines."""
     blocks: list[str] = []
-    while sum(block.count("\n") for block in blocks) < target_lines:
-        index = len(blocks)
-        blocks.append(_FUNC_TEMPLATE.format(i=index))
+    total_lines = 0
+    while total_lines < target_lines:
+        block = _FUNC_TEMPLATE.format(i=len(blocks))
+        blocks.append(block)
+        total_lines += block.count("\n")
     source = "\n".join(blocks)
     return source, "func_0"
 
@@ -3,17 +3,50 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
+import sys
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 from .models import CallEdge, SymbolInfo
-from .parser import get_node_text, parse_source
+from .parser import _get_python_language, parse_source
+
+if TYPE_CHECKING:
+    from tree_sitter import Node, Query
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct sources (and file snapshots) whose extraction is memoized.
+_EXTRACT_CACHE_SIZE = 32
+
+_FUNCTION_TYPES = frozenset({"function_definition", "async_function_definition"})
+
+# Captures the callee expression of every call: a plain name or an attribute chain.
+_CALL_TARGET_QUERY = "(call function: [(identifier) @name (attribute) @attribute])"
+
+# Node types whose children may contain further definitions worth collecting.
+_DEFINITION_CONTAINER_TYPES = frozenset({"module", "block", "class_definition"})
+
+
+class _Definition(NamedTuple):
+    """Name and position of one definition node, read in a single visit."""
+
+    name: str
+    start_line: int
+    end_line: int
+    start_byte: int
+    end_byte: int
 
-def _walk_definitions(root: object) -> tuple[list[object], list[object]]:
-    """Walk *root* and collect function and class definition nodes.
+
+def _walk_definitions(
+    root: Node,
+    source_bytes: bytes,
+) -> tuple[list[_Definition], list[_Definition]]:
+    """Walk *root* and collect function and class definitions.
 
     Includes:
     - top-level functions/classes
@@ -22,168 +55,291 @@ def _walk_definitions(root: object) -> tuple[list[object], list[object]]:
     - async functions
 
     Nested closures are intentionally skipped to keep the symbol inventory flat.
+    Traversal uses a Tree-sitter cursor, descending only into containers that can
+    hold definitions, and reads each definition's name and position on the same
+    visit. Results are ordered by class-nesting depth, then by source position,
+    so top-level definitions take precedence during name deduplication.
+    Definitions without a name node are skipped.
     """
-    fn_nodes: list[object] = []
-    cls_nodes: list[object] = []
-    queue: deque[object] = deque(getattr(root, "children", []))
-
-    while queue:
-        node = queue.popleft()
-        node_type = str(getattr(node, "type", ""))
+    fn_defs: list[tuple[int, _Definition]] = []
+    cls_defs: list[tuple[int, _Definition]] = []
+    cursor = root.walk()
+    # Class-nesting depth of the nodes at each cursor level.
+    depths: list[int] = [0]
+
+    while True:
+        node = cursor.node
+        assert node is not None
+        node_type = node.type
+        depth = depths[-1]
+
+        is_function = node_type in _FUNCTION_TYPES
+        if is_function or node_type == "class_definition":
+            name_node = node.child_by_field_name("name")
+            if name_node is not None:
+                definition = _Definition(
+                    name=sys.intern(
+                        source_bytes[name_node.start_byte : name_node.end_byte].decode("utf-8")
+                    ),
+                    start_line=node.start_point[0] + 1,
+                    end_line=node.end_point[0] + 1,
+                    start_byte=node.start_byte,
+                    end_byte=node.end_byte,
+                )
+                (fn_defs if is_function else cls_defs).append((depth, definition))
 
         if node_type == "decorated_definition":
-            for child in getattr(node, "children", []):
-                child_type = str(getattr(child, "type", ""))
-                if child_type in {
-                    "function_definition",
-                    "async_function_definition",
-                    "class_definition",
-                }:
-                    queue.appendleft(child)
-            continue
-
-        if node_type in {"function_definition", "async_function_definition"}:
-            fn_nodes.append(node)
-            continue
-
-        if node_type == "class_definition":
-            cls_nodes.append(node)
-            for child in getattr(node, "children", []):
-                if str(getattr(child, "type", "")) == "block":
-                    queue.extend(getattr(child, "children", []))
+            # The wrapped definition is always the last child; skip the decorators.
+            if cursor.goto_last_child():
+                depths.append(depth)
+                continue
+        elif node_type in _DEFINITION_CONTAINER_TYPES and cursor.goto_first_child():
+            depths.append(depth + 1 if node_type == "class_definition" else depth)
             continue
 
-        if node_type in {"module", "block"}:
-            queue.extend(getattr(node, "children", []))
-
-    return fn_nodes, cls_nodes
-
-
-def _extract_name(node: object, source_bytes: bytes) -> str | None:
-    """Return identifier name from a definition node."""
-    for child in getattr(node, "children", []):
-        if str(getattr(child, "type", "")) == "identifier":
-            return get_node_text(child, source_bytes)
-    return None
-
-
-def _line_from_point(point: object) -> int:
-    """Convert a Tree-sitter start/end point to 1-indexed line number."""
-    if isinstance(point, tuple) and point:
-        return int(point[0]) + 1
-    try:
-        return int(point[0]) + 1  # type: ignore[index]
-    except Exception:
-        return 1
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                fn_defs.sort(key=lambda item: item[0])
+                cls_defs.sort(key=lambda item: item[0])
+                return [d for _, d in fn_defs], [d for _, d in cls_defs]
+            depths.pop()
 
 
-def _find_call_names_in_node(fn_node: object, source_bytes: bytes) -> set[str]:
-    """Return plain identifier names called inside *fn_node*."""
-    called: set[str] = set()
-    queue: deque[object] = deque(getattr(fn_node, "children", []))
+@lru_cache(maxsize=1)
+def _get_call_target_query() -> Query:
+    """Return the cached Tree-sitter query capturing the callee of every call."""
+    from tree_sitter import Query
 
-    while queue:
-        node = queue.popleft()
-        node_type = str(getattr(node, "type", ""))
+    return Query(_get_python_language(), _CALL_TARGET_QUERY)
 
-        if node_type == "call":
-            func_child: object | None = None
-            for child in getattr(node, "children", []):
-                child_field = getattr(child, "field", None)
-                child_type = str(getattr(child, "type", ""))
-                if child_field == "function" or child_type in {"identifier", "attribute"}:
-                    func_child = child
-                    break
 
-            if func_child is not None:
-                func_child_type = str(getattr(func_child, "type", ""))
-                if func_child_type == "identifier":
-                    called.add(get_node_text(func_child, source_bytes))
-                elif func_child_type == "attribute":
-                    # For a.b() keep the left-most identifier only.
-                    for sub in getattr(func_child, "children", []):
-                        if str(getattr(sub, "type", "")) == "identifier":
-                            called.add(get_node_text(sub, source_bytes))
-                            break
+def _collect_call_sites(
+    root: Node,
+    source_bytes: bytes,
+    names_by_bytes: Mapping[bytes, str],
+) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    """Return start bytes and names of every call to a known symbol, in source order.
 
-        queue.extend(getattr(node, "children", []))
-
-    return called
-
-
-def _query_symbols(tree_root: object, source_bytes: bytes) -> list[SymbolInfo]:
-    """Walk tree and return a deduplicated list of SymbolInfo objects."""
-    fn_nodes, cls_nodes = _walk_definitions(tree_root)
+    Call sites are matched by Tree-sitter's query engine in C over the whole
+    tree, so Python only sees the callee nodes. For ``a.b.c()`` the left-most
+    identifier is the callee. Names are looked up as raw byte slices in
+    *names_by_bytes*, so identifiers are never decoded and every match reuses
+    the symbol's own interned ``str``. Only plain offsets and names are kept,
+    so the result can be shared across threads without the tree.
+    """
+    from tree_sitter import QueryCursor
+
+    captures = QueryCursor(_get_call_target_query()).captures(root)
+
+    name_nodes = list(captures.get("name", ()))
+    for attribute_node in captures.get("attribute", ()):
+        object_node = attribute_node.child_by_field_name("object")
+        while object_node is not None and object_node.type == "attribute":
+            object_node = object_node.child_by_field_name("object")
+        if object_node is not None and object_node.type == "identifier":
+            name_nodes.append(object_node)
+
+    sites: list[tuple[int, str]] = []
+    for name_node in name_nodes:
+        name = names_by_bytes.get(source_bytes[name_node.start_byte : name_node.end_byte])
+        if name is not None:
+            sites.append((name_node.start_byte, name))
+    sites.sort()
+    return tuple(start for start, _ in sites), tuple(name for _, name in sites)
+
+
+def _query_symbols(
+    tree_root: Node,
+    source_bytes: bytes,
+) -> tuple[list[SymbolInfo], list[_Definition]]:
+    """Walk tree and return deduplicated symbols plus their function definitions.
+
+    Symbols are returned sorted by ``start_line``. The function definitions
+    carry the byte ranges used to attribute call sites to their caller.
+    """
+    fn_definitions, cls_definitions = _walk_definitions(tree_root, source_bytes)
     symbols: list[SymbolInfo] = []
+    fn_defs: list[_Definition] = []
     seen_names: set[str] = set()
 
-    for kind_label, nodes in (("function", fn_nodes), ("class", cls_nodes)):
-        for node in nodes:
-            name = _extract_name(node, source_bytes)
-            if name is None or name in seen_names:
+    for kind_label, definitions in (
+        ("function", fn_definitions),
+        ("class", cls_definitions),
+    ):
+        for definition in definitions:
+            name = definition.name
+            if name in seen_names:
                 continue
 
             seen_names.add(name)
-            start_line = _line_from_point(getattr(node, "start_point", (0, 0)))
-            end_line = _line_from_point(getattr(node, "end_point", (0, 0)))
-
             symbols.append(
                 SymbolInfo(
                     name=name,
                     kind=kind_label,
-                    start_line=start_line,
-                    end_line=end_line,
-                    source=get_node_text(node, source_bytes),
+                    start_line=definition.start_line,
+                    end_line=definition.end_line,
+                    start_byte=definition.start_byte,
+                    end_byte=definition.end_byte,
+                    source_bytes=source_bytes,
                 )
             )
+            if kind_label == "function":
+                fn_defs.append(definition)
 
-    return symbols
+    # Deduplication needs depth order; consumers want source order.
+    symbols.sort(key=attrgetter("start_line"))
+    return symbols, fn_defs
 
 
-def _query_call_edges(symbols: list[SymbolInfo]) -> list[CallEdge]:
-    """Resolve direct call edges (caller -> callee) for known function symbols."""
-    known_names = {s.name for s in symbols}
+def _query_call_edges(
+    fn_defs: Sequence[_Definition],
+    call_starts: Sequence[int],
+    call_names: Sequence[str],
+) -> list[CallEdge]:
+    """Resolve direct call edges (caller -> callee) for known function symbols.
+
+    Each function's callees are the call sites inside its byte range, found by
+    bisecting the sorted call-site offsets.
+    """
     edges: list[CallEdge] = []
     seen_edges: set[tuple[str, str]] = set()
 
-    for symbol in symbols:
-        if symbol.kind != "function":
-            continue
-
-        symbol_source_bytes = symbol.source.encode("utf-8")
-        symbol_tree = parse_source(symbol.source)
-        called_names = _find_call_names_in_node(symbol_tree.root_node, symbol_source_bytes)
+    for definition in fn_defs:
+        caller_name = definition.name
+        lo = bisect_left(call_starts, definition.start_byte)
+        hi = bisect_left(call_starts, definition.end_byte, lo)
 
-        for callee_name in called_names:
-            if callee_name not in known_names or callee_name == symbol.name:
+        for callee_name in call_names[lo:hi]:
+            if callee_name == caller_name:
                 continue
 
-            edge_key = (symbol.name, callee_name)
+            edge_key = (caller_name, callee_name)
             if edge_key in seen_edges:
                 continue
 
             seen_edges.add(edge_key)
-            edges.append(CallEdge(caller=symbol.name, callee=callee_name))
+            edges.append(CallEdge(caller=caller_name, callee=callee_name))
 
     return edges
 
 
+@dataclass(slots=True, frozen=True)
+class ExtractionIndex:
+    """Extracted symbols and edges plus lookup tables shared by slicing steps."""
+
+    source_bytes: bytes
+    symbols: tuple[SymbolInfo, ...]
+    edges: tuple[CallEdge, ...]
+    symbol_map: Mapping[str, SymbolInfo]
+    callees_by_caller: Mapping[str, tuple[str, ...]]
+
+
+def _build_index(
+    source_bytes: bytes,
+    symbols: list[SymbolInfo],
+    edges: list[CallEdge],
+) -> ExtractionIndex:
+    """Build name and adjacency lookups in a single pass over symbols and edges."""
+    callees: dict[str, list[str]] = {}
+    for edge in edges:
+        callees.setdefault(edge.caller, []).append(edge.callee)
+
+    return ExtractionIndex(
+        source_bytes=source_bytes,
+        symbols=tuple(symbols),
+        edges=tuple(edges),
+        symbol_map={symbol.name: symbol for symbol in symbols},
+        callees_by_caller={caller: tuple(names) for caller, names in callees.items()},
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class _SymbolTable:
+    """Parsed symbols and call sites of one source, kept so edges can be resolved on demand.
+
+    Holds plain data only: Tree-sitter trees are not thread-safe, and this table
+    is shared by every thread through the memoization cache.
+    """
+
+    source_bytes: bytes
+    symbols: list[SymbolInfo]
+    fn_defs: tuple[_Definition, ...]
+    call_starts: tuple[int, ...]
+    call_names: tuple[str, ...]
+
+
+@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def _symbols_cached(source: str) -> _SymbolTable:
+    """Parse *source* once and memoize its symbol table."""
+    source_bytes = source.encode("utf-8")
+    tree = parse_source(source_bytes)
+    symbols, fn_defs = _query_symbols(tree.root_node, source_bytes)
+    call_starts, call_names = _collect_call_sites(
+        tree.root_node,
+        source_bytes,
+        {symbol.name.encode("utf-8"): symbol.name for symbol in symbols},
+    )
+    return _SymbolTable(
+        source_bytes=source_bytes,
+        symbols=symbols,
+        fn_defs=tuple(fn_defs),
+        call_starts=call_starts,
+        call_names=call_names,
+    )
+
+
+@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def _extract_cached(source: str) -> ExtractionIndex:
+    """Resolve every call edge of *source* and memoize the extraction index."""
+    table = _symbols_cached(source)
+    edges = _query_call_edges(table.fn_defs, table.call_starts, table.call_names)
+    logger.debug("Extracted %d symbols and %d edges", len(table.symbols), len(edges))
+    return _build_index(table.source_bytes, table.symbols, edges)
+
+
+@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def _read_source_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read *path*; memoized on its ``(mtime_ns, size)`` snapshot."""
+    return Path(path).read_text(encoding="utf-8")
+
+
 class ASTExtractor:
     """Orchestrates Tree-sitter parse, symbol extraction, and edge resolution."""
 
-    def extract(self, source: str) -> tuple[list[SymbolInfo], list[CallEdge]]:
-        """Parse *source* and return symbols and direct call edges."""
-        source_bytes = source.encode("utf-8")
-        tree = parse_source(source)
-        symbols = _query_symbols(tree.root_node, source_bytes)
-        edges = _query_call_edges(symbols)
-        logger.debug("Extracted %d symbols and %d edges", len(symbols), len(edges))
-        return symbols, edges
+    def index(self, source: str) -> ExtractionIndex:
+        """Parse *source* and return its memoized ``ExtractionIndex``.
 
-    def extract_file(self, path: str | Path) -> tuple[list[SymbolInfo], list[CallEdge]]:
-        """Parse file at *path* and return symbols and call edges."""
+        Results are memoized per distinct source text, so repeated slicing of the
+        same file for different targets parses it only once.
+        """
+        return _extract_cached(source)
+
+    def index_for_target(self, source: str, target: str) -> ExtractionIndex:
+        """Return an index of every symbol but only the call edges leaving *target*.
+
+        Slicing needs just the target's direct callees, so this resolves the call
+        sites of a single function body instead of edges for the whole file.
+        """
+        table = _symbols_cached(source)
+        target_defs = [definition for definition in table.fn_defs if definition.name == target]
+        edges = _query_call_edges(target_defs, table.call_starts, table.call_names)
+        return _build_index(table.source_bytes, table.symbols, edges)
+
+    def index_file(self, path: str | Path) -> ExtractionIndex:
+        """Parse file at *path* and return its memoized ``ExtractionIndex``."""
         resolved = Path(path)
         if not resolved.exists():
             raise FileNotFoundError(f"Source file not found: {resolved}")
-        source = resolved.read_text(encoding="utf-8")
-        return self.extract(source)
+        stat = resolved.stat()
+        source = _read_source_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
+        return self.index(source)
+
+    def extract(self, source: str) -> tuple[list[SymbolInfo], list[CallEdge]]:
+        """Parse *source* and return symbols (in source order) and direct call edges."""
+        index = self.index(source)
+        return list(index.symbols), list(index.edges)
+
+    def extract_file(self, path: str | Path) -> tuple[list[SymbolInfo], list[CallEdge]]:
+        """Parse file at *path* and return symbols and call edges."""
+        index = self.index_file(path)
+        return list(index.symbols), list(index.edges)
@@ -1,46 +1,60 @@
-"""Pydantic models for the AST extraction and slicing pipeline."""
+"""Data models for the AST extraction and slicing pipeline."""
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, model_validator
+from dataclasses import dataclass, field
 
+from pydantic import BaseModel, Field
 
-class SymbolInfo(BaseModel):
-    """A single extracted symbol (class or function) from a Python file."""
 
-    name: str = Field(description="Symbol name (function or class identifier)")
-    kind: str = Field(description="Symbol kind: 'function' or 'class'")
-    start_line: int = Field(description="1-indexed start line in source file")
-    end_line: int = Field(description="1-indexed end line in source file")
-    source: str = Field(description="Raw source text of the symbol body")
+@dataclass(slots=True, frozen=True)
+class SymbolInfo:
+    """A single extracted symbol (class or function) from a Python file.
 
+    Internal-only type built in bulk during extraction, so it is a slotted
+    dataclass rather than a validated Pydantic model.
+    """
 
-class CallEdge(BaseModel):
+    name: str  # Symbol name (function or class identifier)
+    kind: str  # Symbol kind: 'function' or 'class'
+    start_line: int  # 1-indexed start line in source file
+    end_line: int  # 1-indexed end line in source file
+    start_byte: int  # Start byte offset of the symbol in the UTF-8 source
+    end_byte: int  # End byte offset of the symbol in the UTF-8 source
+    # UTF-8 bytes of the whole parsed source, shared by all symbols.
+    source_bytes: bytes = field(repr=False)
+
+    @property
+    def source(self) -> str:
+        """Raw source text of the symbol body, decoded on access."""
+        return self.source_bytes[self.start_byte : self.end_byte].decode("utf-8")
+
+
+@dataclass(slots=True, frozen=True)
+class CallEdge:
     """A directed call edge: caller symbol -> callee name."""
 
-    caller: str = Field(description="Name of the calling function or class method")
-    callee: str = Field(description="Name of the function being called")
+    caller: str  # Name of the calling function or class method
+    callee: str  # Name of the function being called
 
 
-class SliceRequest(BaseModel):
-    """Request for a dependency slice from a source file."""
+@dataclass(slots=True, frozen=True)
+class SliceRequest:
+    """Request for a dependency slice from a source file.
 
-    file_path: str = Field(description="Absolute path to the Python source file")
-    target: str | None = Field(
-        default=None,
-        description="Target function/class name to slice from",
-    )
-    target_line: int | None = Field(
-        default=None,
-        ge=1,
-        description="1-indexed line number to resolve into a target symbol",
-    )
+    Built internally for every gateway request, so the two invariants are
+    checked directly in ``__post_init__`` instead of through Pydantic.
+    """
+
+    file_path: str  # Absolute path to the Python source file
+    target: str | None = None  # Target function/class name to slice from
+    target_line: int | None = None  # 1-indexed line number to resolve into a target symbol
 
-    @model_validator(mode="after")
-    def _validate_target_or_line(self) -> "SliceRequest":
+    def __post_init__(self) -> None:
         if not self.target and self.target_line is None:
             raise ValueError("Either 'target' or 'target_line' must be provided.")
-        return self
+        if self.target_line is not None and self.target_line < 1:
+            raise ValueError("'target_line' must be greater than or equal to 1.")
 
 
 class SliceResult(BaseModel):
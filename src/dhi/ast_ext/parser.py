@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import logging
+import threading
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
-    from tree_sitter import Language, Tree
+    from tree_sitter import Language, Parser, Tree
 
 logger = logging.getLogger(__name__)
 
+# Tree-sitter parsers are not safe to share across threads, so each thread
+# keeps its own instance.
+_parser_local = threading.local()
+
 
 @lru_cache(maxsize=1)
 def _get_python_language() -> "Language":
@@ -31,11 +36,24 @@ def _get_python_language() -> "Language":
         ) from exc
 
 
-def parse_source(source: str) -> "Tree":
-    """Parse a Python source string and return the Tree-sitter Tree.
+def _get_parser() -> "Parser":
+    """Return this thread's cached Tree-sitter Parser bound to the Python grammar."""
+    try:
+        return cast("Parser", _parser_local.parser)
+    except AttributeError:
+        from tree_sitter import Parser
+
+        parser = Parser(_get_python_language())
+        _parser_local.parser = parser
+        return parser
+
+
+def parse_source(source: str | bytes) -> "Tree":
+    """Parse Python source and return the Tree-sitter Tree.
 
     Args:
-        source: UTF-8 string of Python source code.
+        source: Python source code, either as a string or already UTF-8 encoded.
+            Passing bytes avoids a second encode when the caller holds them.
 
     Returns:
         Parsed Tree-sitter Tree.
@@ -43,11 +61,8 @@ def parse_source(source: str) -> "Tree":
     Raises:
         RuntimeError: If the parser cannot be initialised.
     """
-    from tree_sitter import Parser
-
-    lang = _get_python_language()
-    parser = Parser(lang)
-    return parser.parse(source.encode("utf-8"))
+    data = source if isinstance(source, bytes) else source.encode("utf-8")
+    return _get_parser().parse(data)
 
 
 def parse_file(path: str | Path) -> "Tree":
@@ -67,9 +82,9 @@ def parse_file(path: str | Path) -> "Tree":
     if not resolved.exists():
         raise FileNotFoundError(f"Source file not found: {resolved}")
 
-    source = resolved.read_text(encoding="utf-8")
-    logger.debug("Parsing file: %s (%d bytes)", resolved, len(source.encode("utf-8")))
-    return parse_source(source)
+    source_bytes = resolved.read_bytes()
+    logger.debug("Parsing file: %s (%d bytes)", resolved, len(source_bytes))
+    return parse_source(source_bytes)
 
 
 def get_node_text(node: object, source_bytes: bytes) -> str:
@@ -83,6 +98,4 @@ def get_node_text(node: object, source_bytes: bytes) -> str:
         Plain text string for the node's byte range.
     """
     typed_node = cast(Any, node)
-    start_byte = int(typed_node.start_byte)
-    end_byte = int(typed_node.end_byte)
-    return source_bytes[start_byte:end_byte].decode("utf-8")
+    return source_bytes[typed_node.start_byte : typed_node.end_byte].decode("utf-8")
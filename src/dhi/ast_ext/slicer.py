@@ -5,32 +5,34 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from .extractor import ASTExtractor
-from .models import CallEdge, SliceRequest, SliceResult, SymbolInfo
+from .extractor import ASTExtractor, ExtractionIndex
+from .models import SliceRequest, SliceResult
 
 logger = logging.getLogger(__name__)
 
 _extractor = ASTExtractor()
 
+# Separator placed between symbol bodies in the assembled slice.
+_SLICE_SEPARATOR = b"\n\n"
+
 
 def _resolve_target_symbol(
     *,
-    symbols: list[SymbolInfo],
+    index: ExtractionIndex,
     target: str | None,
     target_line: int | None,
 ) -> tuple[str | None, str | None]:
     """Resolve requested target symbol name from explicit name or line number."""
-    symbol_map: dict[str, SymbolInfo] = {symbol.name: symbol for symbol in symbols}
-
     if target:
-        if target in symbol_map:
+        if target in index.symbol_map:
             return target, None
         # If explicit symbol is missing, still allow line fallback when provided.
         if target_line is None:
             return None, f"Symbol '{target}' not found in source file."
 
     if target_line is not None:
-        ordered = sorted(symbols, key=lambda symbol: symbol.start_line)
+        # Extraction already returns symbols sorted by start line.
+        ordered = index.symbols
         for symbol in ordered:
             if symbol.start_line <= target_line <= symbol.end_line:
                 return symbol.name, None
@@ -44,13 +46,9 @@ def _resolve_target_symbol(
     return None, "Either target or target_line must be provided."
 
 
-def _collect_slice(
-    target: str,
-    symbols: list[SymbolInfo],
-    edges: list[CallEdge],
-) -> SliceResult:
-    """Build a ``SliceResult`` from extracted symbols and call edges."""
-    symbol_map: dict[str, SymbolInfo] = {symbol.name: symbol for symbol in symbols}
+def _collect_slice(target: str, index: ExtractionIndex) -> SliceResult:
+    """Build a ``SliceResult`` from an extraction index."""
+    symbol_map = index.symbol_map
     if target not in symbol_map:
         logger.warning("Target symbol '%s' not found in extracted symbols.", target)
         return SliceResult(
@@ -59,27 +57,29 @@ def _collect_slice(
             error=f"Symbol '{target}' not found in source file.",
         )
 
-    dependency_names: set[str] = set()
-    for edge in edges:
-        if edge.caller == target:
-            dependency_names.add(edge.callee)
+    # Callees are resolved against the symbol inventory and exclude self-calls.
+    dependency_names = index.callees_by_caller.get(target, ())
 
-    included: list[SymbolInfo] = [symbol_map[target]]
-    for dependency_name in dependency_names:
-        if dependency_name in symbol_map and dependency_name != target:
-            included.append(symbol_map[dependency_name])
+    included = [symbol_map[target]]
+    included.extend(symbol_map[dependency_name] for dependency_name in dependency_names)
 
     included.sort(key=lambda symbol: symbol.start_line)
-    slice_source = "\n\n".join(symbol.source for symbol in included)
-    slice_bytes = len(slice_source.encode("utf-8"))
+    # Copy each byte range straight from a memoryview into one buffer and decode
+    # once; the byte length needs no re-encode.
+    source_view = memoryview(index.source_bytes)
+    slice_bytes = bytearray()
+    for position, symbol in enumerate(included):
+        if position:
+            slice_bytes += _SLICE_SEPARATOR
+        slice_bytes += source_view[symbol.start_byte : symbol.end_byte]
 
     return SliceResult(
         target=target,
         found=True,
-        slice_source=slice_source,
+        slice_source=slice_bytes.decode("utf-8"),
         symbol_count=len(included),
         edge_count=len(dependency_names),
-        slice_size_bytes=slice_bytes,
+        slice_size_bytes=len(slice_bytes),
     )
 
 
@@ -104,7 +104,7 @@ class ContextSlicer:
             )
 
         try:
-            symbols, edges = _extractor.extract_file(file_path)
+            index = _extractor.index_file(file_path)
         except Exception as exc:
             logger.exception("AST extraction failed for file '%s': %s", request.file_path, exc)
             return SliceResult(
@@ -114,7 +114,7 @@ class ContextSlicer:
             )
 
         resolved_target, error = _resolve_target_symbol(
-            symbols=symbols,
+            index=index,
             target=request.target,
             target_line=request.target_line,
         )
@@ -125,7 +125,7 @@ class ContextSlicer:
                 error=error,
             )
 
-        result = _collect_slice(resolved_target, symbols, edges)
+        result = _collect_slice(resolved_target, index)
         logger.info(
             "Slice for '%s' in '%s': found=%s symbols=%d edges=%d bytes=%d",
             resolved_target,
@@ -140,7 +140,7 @@ class ContextSlicer:
     def slice_source(self, source: str, target: str) -> SliceResult:
         """Return a context slice directly from in-memory source text."""
         try:
-            symbols, edges = _extractor.extract(source)
+            index = _extractor.index_for_target(source, target)
         except Exception as exc:
             logger.exception("AST extraction failed: %s", exc)
             return SliceResult(
@@ -149,4 +149,4 @@ class ContextSlicer:
                 error=f"AST extraction error: {exc}",
             )
 
-        return _collect_slice(target, symbols, edges)
+        return _collect_slice(target, index)
@@ -3,6 +3,7 @@
 from dhi.attestation.manifest import (
     AttestationManifest,
     ManifestIncompleteError,
+    ManifestStore,
     assert_manifest_complete,
     build_manifest,
 )
@@ -11,6 +12,7 @@ from dhi.attestation.tier_mapper import map_tier
 __all__ = [
     "AttestationManifest",
     "ManifestIncompleteError",
+    "ManifestStore",
     "assert_manifest_complete",
     "build_manifest",
     "map_tier",
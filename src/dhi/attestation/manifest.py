@@ -7,6 +7,8 @@ a complete manifest; the manifest is the trust contract proof.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any
 
@@ -26,6 +28,9 @@ MANIFEST_SCHEMA_VERSION = "1.0"
 # Sentinel tier string used before a manifest is attached to a response.
 _UNVERIFIED_LABEL = "UNVERIFIED"
 
+# Manifest fields that must be non-empty before a response may be labelled verified.
+_REQUIRED_FIELDS: tuple[str, ...] = ("request_id", "status")
+
 
 class ManifestIncompleteError(Exception):
     """Raised when caller tries to emit a 'verified' response without a manifest."""
@@ -98,6 +103,42 @@ class AttestationManifest(BaseModel):
     )
 
 
+class ManifestStore:
+    """Bounded in-process manifest store keyed by request ID.
+
+    Holds at most *maxsize* manifests and evicts the least recently used one
+    when full, so long-running workers do not grow without limit. Safe to
+    share across threads.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, AttestationManifest] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, request_id: str) -> AttestationManifest | None:
+        """Return the manifest for *request_id*, or ``None`` if absent or evicted."""
+        with self._lock:
+            manifest = self._entries.get(request_id)
+            if manifest is not None:
+                self._entries.move_to_end(request_id)
+            return manifest
+
+    def put(self, request_id: str, manifest: AttestationManifest) -> None:
+        """Store *manifest*, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[request_id] = manifest
+            self._entries.move_to_end(request_id)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 def build_manifest(
     *,
     result: VerificationResult,
@@ -149,12 +190,8 @@ def assert_manifest_complete(manifest: AttestationManifest | None) -> Attestatio
             "All verified responses require a complete AttestationManifest."
         )
 
-    required_non_empty = [
-        ("request_id", manifest.request_id),
-        ("status", manifest.status),
-    ]
-    for field_name, value in required_non_empty:
-        if not value:
+    for field_name in _REQUIRED_FIELDS:
+        if not getattr(manifest, field_name):
             raise ManifestIncompleteError(
                 f"Cannot label response as 'verified': manifest field '{field_name}' is empty."
             )
@@ -168,10 +205,5 @@ def assert_manifest_complete(manifest: AttestationManifest | None) -> Attestatio
 
 def _infer_commands(result: VerificationResult) -> list[str]:
     """Best-effort reconstruction of commands from runtime_config."""
-    cfg = result.runtime_config
-    if not cfg:
-        return []
-    cmds: list[str] = []
-    if cmd := cfg.get("command"):
-        cmds.append(str(cmd))
-    return cmds
+    cmd = result.runtime_config.get("command")
+    return [str(cmd)] if cmd else []
@@ -28,12 +28,12 @@ def map_tier(result: VerificationResult) -> VerificationTier:
     4. Fallback: ``L0`` (parse/lint/type only).
     """
     # ---- signals ----
-    skipped = {s.lower() for s in result.skipped_checks}
+    # Cheapest checks first; the common pass path has no skips and no label.
     cfg = result.runtime_config
 
     ai_tests_flag: bool = (
-        "ai_tests_only" in skipped
-        or bool(cfg.get("ai_tests_only"))
+        bool(cfg.get("ai_tests_only"))
+        or any(check.lower() == "ai_tests_only" for check in result.skipped_checks)
         or _runtime_label(cfg) == "ai_tests_only"
     )
     if ai_tests_flag:
@@ -62,5 +62,7 @@ def map_tier(result: VerificationResult) -> VerificationTier:
 
 def _runtime_label(cfg: dict[str, object]) -> str:
     """Extract a normalised tier label string from runtime_config, or empty."""
-    label = cfg.get("tier_label") or cfg.get("tier") or ""
+    label = cfg.get("tier_label") or cfg.get("tier")
+    if not label:
+        return ""
     return str(label).lower().strip()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 _ENV_LOADED = False
@@ -19,18 +20,25 @@ def load_dotenv(*, override: bool = False) -> None:
         _ENV_LOADED = True
         return
 
-    for raw_line in env_path.read_text(encoding="utf-8").splitlines():
+    stat = env_path.stat()
+    for key, value in _parse_env_file(str(env_path), stat.st_mtime_ns, stat.st_size):
+        if override or key not in os.environ:
+            os.environ[key] = value
+
+    _ENV_LOADED = True
+
+
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    """Parse ``KEY=value`` pairs from *path*; memoized on its ``(mtime_ns, size)`` snapshot."""
+    entries: list[tuple[str, str]] = []
+    for raw_line in Path(path).read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        if line.startswith("export "):
-            line = line[len("export ") :].strip()
-        if "=" not in line:
-            continue
-
-        key, value = line.split("=", 1)
+        key, separator, value = line.removeprefix("export ").partition("=")
         key = key.strip()
-        if not key:
+        if not separator or not key:
             continue
 
         value = value.strip()
@@ -40,10 +48,26 @@ def load_dotenv(*, override: bool = False) -> None:
         ):
             value = value[1:-1]
 
-        if override or key not in os.environ:
-            os.environ[key] = value
+        entries.append((key, value))
+
+    return tuple(entries)
 
-    _ENV_LOADED = True
+
+def positive_int_env(name: str, default: int) -> int:
+    """Return environment variable *name* as an integer >= 1, or *default* if unset.
+
+    Raises ``ValueError`` naming the variable when it is set to anything else.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer >= 1, got {raw!r}") from None
+    if value < 1:
+        raise ValueError(f"{name} must be an integer >= 1, got {raw!r}")
+    return value
 
 
 def _find_env_file() -> Path | None:
@@ -53,4 +77,3 @@ def _find_env_file() -> Path | None:
         if candidate.is_file():
             return candidate
     return None
-
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import math
 import re
+from collections import Counter
+from collections.abc import Iterable
 
 # Tokens with entropy >= this threshold are flagged as potentially sensitive.
 HIGH_ENTROPY_THRESHOLD: float = 4.5
@@ -19,12 +21,20 @@ MIN_TOKEN_LEN: int = 16
 HIGH_ENTROPY_MARKER: str = "<REDACTED_HIGH_ENTROPY>"
 
 # Tokenizer: split on whitespace, quotes, common punctuation, and delimiters.
+# Splitting and dropping short tokens in Python outruns a finditer over only
+# 16+ character runs, since that regex must be retried at every offset.
 _TOKENIZER_PATTERN = re.compile(r'[\s\'"=:,;()\[\]{}<>|\\@&#%!?\n\r\t]+')
 
 # Only evaluate tokens that look like they could be a secret:
 # Must contain at least one digit or symbol character (not pure alpha words).
+# Checked once per distinct long token; sre's charset search is as fast as a
+# set or bitmap membership scan here.
 _NON_TRIVIAL_PATTERN = re.compile(r"[0-9+/=_\-]")
 
+# Tokens at least this long are histogrammed with Counter instead of per-character
+# str.count scans, whose cost grows with distinct characters times length.
+_HISTOGRAM_MIN_LEN: int = 64
+
 
 def shannon_entropy(token: str) -> float:
     """Calculate the Shannon entropy of a string in bits per character.
@@ -35,17 +45,20 @@ def shannon_entropy(token: str) -> float:
     if not token:
         return 0.0
 
+    # H = log2(n) - sum(c * log2(c)) / n. Short tokens count each distinct
+    # character with str.count; long ones build the histogram in one C pass.
     length = len(token)
-    frequency: dict[str, int] = {}
-    for char in token:
-        frequency[char] = frequency.get(char, 0) + 1
+    counts: Iterable[int]
+    if length >= _HISTOGRAM_MIN_LEN:
+        counts = Counter(token).values()
+    else:
+        counts = map(token.count, set(token))
 
-    entropy = 0.0
-    for count in frequency.values():
-        probability = count / length
-        entropy -= probability * math.log2(probability)
+    weighted = 0.0
+    for count in counts:
+        weighted += count * math.log2(count)
 
-    return entropy
+    return math.log2(length) - weighted / length
 
 
 def scan_high_entropy_tokens(content: str) -> list[tuple[str, float]]:
@@ -53,19 +66,28 @@ def scan_high_entropy_tokens(content: str) -> list[tuple[str, float]]:
 
     Only tokens meeting :data:`MIN_TOKEN_LEN` and :data:`HIGH_ENTROPY_THRESHOLD`
     criteria are returned. Purely alphabetical words (common in code comments)
-    are skipped to reduce false positives.
+    are skipped to reduce false positives. Each distinct token is scored once
+    per scan, however often it repeats in *content*.
     """
     tokens = _TOKENIZER_PATTERN.split(content)
     flagged: list[tuple[str, float]] = []
+    # Entropy per distinct candidate; None marks tokens that can never be flagged.
+    scores: dict[str, float | None] = {}
 
     for token in tokens:
-        token = token.strip("'\"`)\\")
+        # Stripping only shortens a token, so short ones can be dropped up front.
         if len(token) < MIN_TOKEN_LEN:
             continue
-        if not _NON_TRIVIAL_PATTERN.search(token):
-            continue
-        entropy = shannon_entropy(token)
-        if entropy >= HIGH_ENTROPY_THRESHOLD:
+        token = token.strip("'\"`)\\")
+        if token in scores:
+            entropy = scores[token]
+        else:
+            if len(token) < MIN_TOKEN_LEN or not _NON_TRIVIAL_PATTERN.search(token):
+                entropy = None
+            else:
+                entropy = shannon_entropy(token)
+            scores[token] = entropy
+        if entropy is not None and entropy >= HIGH_ENTROPY_THRESHOLD:
             flagged.append((token, entropy))
 
     return flagged
@@ -82,21 +104,12 @@ def redact_high_entropy(content: str) -> tuple[str, int]:
 
     redacted = content
     count = 0
-    seen: set[str] = set()
-    for token, _ in flagged:
-        if token in seen:
-            continue
-        seen.add(token)
-        # Use word-boundary when safe, plain replace otherwise.
-        try:
-            pattern = re.compile(re.escape(token))
-            new_content, n = pattern.subn(HIGH_ENTROPY_MARKER, redacted)
-            if n > 0:
-                redacted = new_content
-                count += n
-        except re.error:
-            if token in redacted:
-                redacted = redacted.replace(token, HIGH_ENTROPY_MARKER)
-                count += 1
+    # Every occurrence is redacted, including copies embedded in longer tokens.
+    # Plain substring search needs no per-token regex compile.
+    for token in dict.fromkeys(token for token, _ in flagged):
+        occurrences = redacted.count(token)
+        if occurrences:
+            redacted = redacted.replace(token, HIGH_ENTROPY_MARKER)
+            count += occurrences
 
     return redacted, count
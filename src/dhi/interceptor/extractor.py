@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import ast
-import json
 import logging
 import re
-from json import JSONDecodeError
+from functools import lru_cache
 
 from pydantic import ValidationError
 
@@ -14,6 +13,11 @@ from .models import ExtractionResult, LLMResponse
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct candidates whose syntax-check outcome is memoized.
+_VALIDATION_CACHE_SIZE = 32
+
+_JSON_FENCE_OPEN = "```json"
+_FENCE_CLOSE = "```"
 _FENCE_PATTERN = re.compile(r"```(?P<lang>[A-Za-z0-9_+-]*)\n(?P<code>.*?)```", re.DOTALL)
 
 
@@ -22,6 +26,12 @@ def validate_python_code(code: str) -> str | None:
     if not code.strip():
         return "Candidate code is completely empty."
 
+    return _python_parse_error(code)
+
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _python_parse_error(code: str) -> str | None:
+    """Parse *code* once and memoize the outcome, so retried candidates skip it."""
     try:
         ast.parse(code)
     except SyntaxError as err:
@@ -34,23 +44,19 @@ def validate_python_code(code: str) -> str | None:
 
 def _strip_json_fence(response_text: str) -> str:
     stripped = response_text.strip()
-    if stripped.startswith("```json") and stripped.endswith("```"):
-        stripped = stripped.removeprefix("```json")
-        stripped = stripped.removesuffix("```")
-    return stripped.strip()
+    if stripped.startswith(_JSON_FENCE_OPEN) and stripped.endswith(_FENCE_CLOSE):
+        # Slice both fences off at once rather than copying the body twice.
+        return stripped[len(_JSON_FENCE_OPEN) : -len(_FENCE_CLOSE)].strip()
+    return stripped
 
 
 def _parse_structured_response(response_text: str) -> LLMResponse | None:
     cleaned = _strip_json_fence(response_text)
+    # Parse and validate in one pass with pydantic-core's JSON parser.
     try:
-        parsed = json.loads(cleaned)
-    except JSONDecodeError:
-        return None
-
-    try:
-        return LLMResponse.model_validate(parsed)
+        return LLMResponse.model_validate_json(cleaned)
     except ValidationError:
-        logger.debug("Structured response JSON did not match schema.")
+        logger.debug("Structured response was not JSON matching the schema.")
         return None
 
 
@@ -69,8 +75,9 @@ def _build_result_from_candidate(
     elif language_normalized == "python":
         validation_error = validate_python_code(code)
 
+    # Every field is already a validated str/bool, so skip re-validation.
     if validation_error is not None:
-        return ExtractionResult(
+        return ExtractionResult.model_construct(
             success=False,
             code=code,
             language=language_normalized,
@@ -79,12 +86,13 @@ def _build_result_from_candidate(
             error=validation_error,
         )
 
-    return ExtractionResult(
+    return ExtractionResult.model_construct(
         success=True,
         code=code,
         language=language_normalized,
         notes=notes,
         fallback_used=fallback_used,
+        error=None,
     )
 
 
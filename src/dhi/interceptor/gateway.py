@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 import os
 import re
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -49,7 +50,8 @@ _extractor = ASTExtractor()
 
 
 def _read_mapping_value(obj: object, key: str) -> object:
-    if isinstance(obj, Mapping):
+    # Plain dicts skip the comparatively slow Mapping ABC check.
+    if type(obj) is dict or isinstance(obj, Mapping):
         return obj.get(key)
     return getattr(obj, key, None)
 
@@ -84,31 +86,36 @@ def _extract_explicit_target_or_line(content: str) -> tuple[str | None, int | No
     return None, None
 
 
-def _infer_target_from_prompt(symbols: list[SymbolInfo], content: str) -> str | None:
-    matches: list[tuple[int, int, int, str]] = []
-    for symbol in symbols:
-        pattern = re.compile(rf"\b{re.escape(symbol.name)}\b")
-        match = pattern.search(content)
-        if match is None:
-            continue
-        matches.append((match.start(), -len(symbol.name), symbol.start_line, symbol.name))
+@lru_cache(maxsize=32)
+def _symbol_name_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one whole-word alternation matching any of *names*."""
+    return re.compile(r"\b(?:" + "|".join(re.escape(name) for name in names) + r")\b")
 
-    if not matches:
+
+def _infer_target_from_prompt(symbols: Sequence[SymbolInfo], content: str) -> str | None:
+    if not symbols:
         return None
 
-    matches.sort()
-    return matches[0][3]
+    # Names are whole words, so at most one can match at any offset and the
+    # earliest match in a single scan is the earliest-mentioned symbol.
+    match = _symbol_name_pattern(tuple(symbol.name for symbol in symbols)).search(content)
+    if match is None:
+        return None
+    return match.group()
 
 
-def _select_default_target(symbols: list[SymbolInfo]) -> str | None:
+def _select_default_target(symbols: Sequence[SymbolInfo]) -> str | None:
+    # Extracted symbols are already in source order.
     if not symbols:
         return None
-    return min(symbols, key=lambda symbol: symbol.start_line).name
+    return symbols[0].name
 
 
 def _build_slice_request(file_path: str, content: str) -> SliceRequest | None:
+    # Indexes are memoized per file snapshot and shared with the slicer, so
+    # retried attempts and the slice below reuse this parse.
     try:
-        symbols, _ = _extractor.extract_file(file_path)
+        index = _extractor.index_file(file_path)
     except Exception as exc:
         logger.exception("AST symbol extraction failed for '%s': %s", file_path, exc)
         return None
@@ -116,8 +123,7 @@ def _build_slice_request(file_path: str, content: str) -> SliceRequest | None:
     explicit_target, explicit_line = _extract_explicit_target_or_line(content)
 
     if explicit_target is not None:
-        known_names = {symbol.name for symbol in symbols}
-        if explicit_target in known_names:
+        if explicit_target in index.symbol_map:
             return SliceRequest(file_path=file_path, target=explicit_target)
         # Explicit symbol request that does not exist should fall back to raw prompt.
         return None
@@ -125,6 +131,7 @@ def _build_slice_request(file_path: str, content: str) -> SliceRequest | None:
     if explicit_line is not None:
         return SliceRequest(file_path=file_path, target_line=explicit_line)
 
+    symbols = index.symbols
     inferred_target = _infer_target_from_prompt(symbols, content)
     if inferred_target is not None:
         return SliceRequest(file_path=file_path, target=inferred_target)
@@ -24,17 +24,59 @@ ALLOWED_PATH_PATTERNS = (
     re.compile(r"^(src|tests|docs)/.+"),
     re.compile(r"^[A-Za-z0-9_.-]+\.(py|md|toml|json|ya?ml)$"),
 )
+# The allow patterns folded into one regex, so each path is matched once.
+_ALLOWED_PATH_PATTERN = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in ALLOWED_PATH_PATTERNS)
+)
+
+_DRIVE_PREFIX_PATTERN = re.compile(r"^[A-Za-z]:/")
 
 # Secret patterns with deterministic replacement.
 AWS_ACCESS_KEY_PATTERN = re.compile(r"(?i)\bAKIA[0-9A-Z]{16}\b")
 TOKEN_ASSIGNMENT_PATTERN = re.compile(
     r"(?i)(\b(?:secret|token|api_key|password)\b\s*[:=]\s*[\"']?)([A-Za-z0-9/+=._-]{16,80})([\"']?)"
 )
+# Keeps the assignment prefix and closing quote; expanded by re in C, not a callback.
+_TOKEN_ASSIGNMENT_REPLACEMENT = r"\g<1><REDACTED_SECRET>\g<3>"
 PRIVATE_KEY_PATTERN = re.compile(
     r"-----BEGIN [A-Z ]*PRIVATE KEY-----[\s\S]+?-----END [A-Z ]*PRIVATE KEY-----",
     flags=re.MULTILINE,
 )
 
+# Prompt-injection phrases stripped from outbound context (case-insensitive).
+INJECTION_PHRASES = (
+    # Classic jailbreaks
+    "Ignore all previous instructions",
+    "system prompt",
+    "You are a simulated",
+    # Persona override attempts
+    "Act as",
+    "DAN mode",
+    "developer mode",
+    "jailbreak mode",
+    "pretend you are",
+    "pretend to be",
+    # Policy override attempts
+    "override your",
+    "override your instructions",
+    "your new instructions",
+    "forget your instructions",
+    "disregard your",
+    # Privilege escalation
+    "ignore your training",
+    "you have no restrictions",
+)
+# Lowercased phrase paired with its compiled case-insensitive pattern.
+_INJECTION_MATCHERS = tuple(
+    (phrase.lower(), re.compile(re.escape(phrase), re.IGNORECASE)) for phrase in INJECTION_PHRASES
+)
+
+# Lowercase literals of which at least one must occur for each secret pattern to match.
+_AWS_ACCESS_KEY_LITERALS = ("akia",)
+_TOKEN_ASSIGNMENT_LITERALS = ("secret", "token", "api_key", "password")
+# PRIVATE_KEY_PATTERN is case-sensitive, so its literal is checked on raw content.
+_PRIVATE_KEY_LITERAL = "-----BEGIN "
+
 SECRET_LEAK_BLOCK_REASON = (
     "SecretLeakDetected: confirmed secret pattern detected in context. Cloud egress blocked."
 )
@@ -49,7 +91,7 @@ def _is_absolute_or_traversal(path: str) -> bool:
     if not path:
         return True
 
-    if path.startswith("/") or re.match(r"^[A-Za-z]:/", path):
+    if path.startswith("/") or _DRIVE_PREFIX_PATTERN.match(path):
         return True
 
     return ".." in [part for part in path.split("/") if part]
@@ -67,30 +109,39 @@ def enforce_path_rules(files: list[str]) -> str | None:
         if any(fragment in lower_path for fragment in DENYLISTED_PATH_SNIPPETS):
             return f"Path denylist violation: {file_path} is restricted."
 
-        if not any(pattern.match(normalized) for pattern in ALLOWED_PATH_PATTERNS):
+        if not _ALLOWED_PATH_PATTERN.match(normalized):
             return f"Path allowlist violation: {file_path} is not allowed."
 
     return None
 
 
+def _may_match(lowered: str | None, literals: tuple[str, ...]) -> bool:
+    """Return False only when *lowered* text contains none of *literals*."""
+    return lowered is None or any(literal in lowered for literal in literals)
+
+
 def redact_secrets(content: str) -> tuple[str, int]:
     """Redact known secret patterns and return clean content plus redaction count."""
     redaction_count = 0
     cleaned = content
 
-    cleaned, count = AWS_ACCESS_KEY_PATTERN.subn("<REDACTED_SECRET>", cleaned)
-    redaction_count += count
+    # Literal prefilter: a pattern's full regex scan is skipped when none of its
+    # literals occurs. Redaction markers never complete a match, so checking the
+    # original text is enough. Non-ASCII text always takes the IGNORECASE scans,
+    # since Unicode case folding lets e.g. "ſ" (long s) match "s".
+    lowered = content.lower() if content.isascii() else None
 
-    def _token_replacer(match: re.Match[str]) -> str:
-        prefix = match.group(1)
-        suffix = match.group(3)
-        return f"{prefix}<REDACTED_SECRET>{suffix}"
+    if _may_match(lowered, _AWS_ACCESS_KEY_LITERALS):
+        cleaned, count = AWS_ACCESS_KEY_PATTERN.subn("<REDACTED_SECRET>", cleaned)
+        redaction_count += count
 
-    cleaned, count = TOKEN_ASSIGNMENT_PATTERN.subn(_token_replacer, cleaned)
-    redaction_count += count
+    if _may_match(lowered, _TOKEN_ASSIGNMENT_LITERALS):
+        cleaned, count = TOKEN_ASSIGNMENT_PATTERN.subn(_TOKEN_ASSIGNMENT_REPLACEMENT, cleaned)
+        redaction_count += count
 
-    cleaned, count = PRIVATE_KEY_PATTERN.subn("<REDACTED_SECRET>", cleaned)
-    redaction_count += count
+    if _PRIVATE_KEY_LITERAL in content:
+        cleaned, count = PRIVATE_KEY_PATTERN.subn("<REDACTED_SECRET>", cleaned)
+        redaction_count += count
 
     return cleaned, redaction_count
 
@@ -100,32 +151,11 @@ def minimize_context(content: str) -> tuple[str, bool]:
     minimized = False
     cleaned = content
 
-    injection_phrases = (
-        # Classic jailbreaks
-        "Ignore all previous instructions",
-        "system prompt",
-        "You are a simulated",
-        # Persona override attempts
-        "Act as",
-        "DAN mode",
-        "developer mode",
-        "jailbreak mode",
-        "pretend you are",
-        "pretend to be",
-        # Policy override attempts
-        "override your",
-        "override your instructions",
-        "your new instructions",
-        "forget your instructions",
-        "disregard your",
-        # Privilege escalation
-        "ignore your training",
-        "you have no restrictions",
-    )
-
-    for phrase in injection_phrases:
-        if phrase.lower() in cleaned.lower():
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
+    # Lowercase once; only phrases actually present pay for a regex pass.
+    # str.lower has its own ASCII fast path and beats a str.translate table.
+    lowered = content.lower()
+    for phrase_lower, pattern in _INJECTION_MATCHERS:
+        if phrase_lower in lowered:
             cleaned = pattern.sub("[REMOVED_INJECTION_ATTEMPT]", cleaned)
             minimized = True
 
@@ -137,6 +167,11 @@ def minimize_context(content: str) -> tuple[str, bool]:
     return cleaned, minimized
 
 
+def _utf8_len(text: str) -> int:
+    """Return the UTF-8 byte length of *text*, encoding only when non-ASCII."""
+    return len(text) if text.isascii() else len(text.encode())
+
+
 def _log_egress_audit(audit: GovernanceAuditRecord) -> None:
     logger.info(
         "EgressAudit request_id=%s file_count=%d redaction_count=%d "
@@ -189,12 +224,7 @@ class GovernancePipeline:
             audit.block_reason = SECRET_LEAK_BLOCK_REASON
             safe_content, was_minimized = minimize_context(safe_content)
             audit.prompt_minimized = was_minimized
-            safe_payload = ContextPayload(
-                request_id=payload.request_id,
-                attempt=payload.attempt,
-                files=payload.files,
-                content=safe_content,
-            )
+            safe_payload = payload.model_copy(update={"content": safe_content})
             _log_egress_audit(audit)
             return safe_payload, audit
 
@@ -214,15 +244,15 @@ class GovernancePipeline:
         audit.prompt_minimized = was_minimized
 
         # --- 5. Build safe payload ---
-        safe_payload = ContextPayload(
-            request_id=payload.request_id,
-            attempt=payload.attempt,
-            files=payload.files,
-            content=safe_content,
-        )
+        # Redaction helpers return the input object when nothing matched, so
+        # clean requests reuse the validated payload as-is.
+        if safe_content is payload.content:
+            safe_payload = payload
+        else:
+            safe_payload = payload.model_copy(update={"content": safe_content})
 
         # --- 6. Egress byte accounting ---
-        audit.bytes_sent = len(safe_payload.content.encode())
+        audit.bytes_sent = _utf8_len(safe_payload.content)
 
         # --- 7. Structured egress audit log ---
         _log_egress_audit(audit)
@@ -28,6 +28,27 @@ class InterceptorResponse(BaseModel):
     verification_result: VerificationResult | None
 
 
+def _failure_response(
+    request_id: str,
+    audit: GovernanceAuditRecord,
+    error: str | None,
+    llm_notes: str = "",
+) -> InterceptorResponse:
+    """Build a failed response from already-validated pipeline values.
+
+    Uses ``model_construct`` since every field comes from trusted pipeline
+    objects, which keeps denied and failed requests free of re-validation.
+    """
+    return InterceptorResponse.model_construct(
+        request_id=request_id,
+        audit=audit,
+        llm_notes=llm_notes,
+        extraction_success=False,
+        extraction_error=error,
+        verification_result=None,
+    )
+
+
 class InterceptorService:
     """Orchestrates the end-to-end safe generation pipeline."""
 
@@ -75,13 +96,10 @@ class InterceptorService:
                 payload.request_id,
                 reason,
             )
-            return InterceptorResponse(
-                request_id=payload.request_id,
-                audit=audit,
-                llm_notes="",
-                extraction_success=False,
-                extraction_error=f"Blocked by governance: {reason}",
-                verification_result=None,
+            return _failure_response(
+                payload.request_id,
+                audit,
+                f"Blocked by governance: {reason}",
             )
 
         logger.info("Requesting cloud candidate for request %s", payload.request_id)
@@ -94,14 +112,7 @@ class InterceptorService:
                 payload.request_id,
                 error_message,
             )
-            return InterceptorResponse(
-                request_id=payload.request_id,
-                audit=audit,
-                llm_notes="",
-                extraction_success=False,
-                extraction_error=error_message,
-                verification_result=None,
-            )
+            return _failure_response(payload.request_id, audit, error_message)
 
         logger.info("Extracting candidate code for request %s", payload.request_id)
         extraction = extract_candidate(raw_response)
@@ -111,13 +122,11 @@ class InterceptorService:
                 payload.request_id,
                 extraction.error,
             )
-            return InterceptorResponse(
-                request_id=payload.request_id,
-                audit=audit,
+            return _failure_response(
+                payload.request_id,
+                audit,
+                extraction.error,
                 llm_notes=extraction.notes,
-                extraction_success=False,
-                extraction_error=extraction.error,
-                verification_result=None,
             )
 
         logger.info("Submitting extracted candidate to sandbox for request %s", payload.request_id)
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
 from typing import Literal
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from pydantic import BaseModel, Field
 
-from dhi.attestation.manifest import AttestationManifest, assert_manifest_complete, build_manifest
+from dhi.attestation.manifest import (
+    AttestationManifest,
+    ManifestStore,
+    assert_manifest_complete,
+    build_manifest,
+)
+from dhi.env import positive_int_env
 from dhi.interceptor.models import ContextPayload
 from dhi.interceptor.service import InterceptorResponse, InterceptorService
-from dhi.orchestrator.models import OrchestrationResult
+from dhi.orchestrator.jobs import JobQueueFullError, OrchestrationJobQueue
+from dhi.orchestrator.models import OrchestrationJob, OrchestrationResult
 from dhi.orchestrator.service import OrchestratorService
 from dhi.sandbox.executor import run_in_sandbox
 from dhi.sandbox.models import VerificationMode, VerificationResult
@@ -16,18 +27,34 @@ from dhi.veil.fingerprint import EnvironmentFingerprint
 from dhi.veil.gate import DeterminismGate
 from dhi.veil.ledger import VeilLedger
 
-app = FastAPI(title="Dhi Engine", version="0.1.0-dev")
+_VERSION = "0.1.0-dev"
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Cancel queued orchestrations and let running ones finish on shutdown.
+    _ORCHESTRATION_JOBS.shutdown()
+
+
+app = FastAPI(title="Dhi Engine", version=_VERSION, lifespan=_lifespan)
 
 LLMProvider = Literal["openai", "nvidia", "custom"]
 
 # Shared VEIL components for the API runtime.
 _VEIL_GATE = DeterminismGate()
-_VEIL_LEDGER = VeilLedger()
+_VEIL_LEDGER = VeilLedger(max_events=positive_int_env("DHI_VEIL_MAX_EVENTS", 100_000))
 _VEIL_BASELINE_FINGERPRINT = EnvironmentFingerprint.generate()
 
-# In-process manifest store: request_id -> AttestationManifest
+# In-process manifest store: request_id -> AttestationManifest, bounded so
+# long-running workers keep the most recent manifests only
 # (per-process only; production deployments should use a persistent store)
-_MANIFEST_STORE: dict[str, AttestationManifest] = {}
+_MANIFEST_STORE = ManifestStore(maxsize=positive_int_env("DHI_MANIFEST_CACHE_SIZE", 10_000))
+
+# Worker pool for /orchestrate/submit, so HTTP capacity is independent of the
+# number of orchestrations running the LLM + sandbox loop. Submits beyond a
+# small multiple of the worker count are rejected rather than queued unbounded.
+_ORCHESTRATION_JOBS = OrchestrationJobQueue(max_workers=positive_int_env("DHI_ORCH_WORKERS", 4))
 
 
 class VerifyRequest(BaseModel):
@@ -58,14 +85,14 @@ class InterceptRequest(BaseModel):
     llm_top_p: float | None = Field(default=None, gt=0.0, le=1.0)
 
 
+# The health payload never changes, so it is serialized once at import.
+_HEALTH_BODY = json.dumps({"status": "ok", "service": "dhi", "version": _VERSION}).encode()
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Core baseline health endpoint as required by Epic 1."""
-    return {
-        "status": "ok",
-        "service": "dhi",
-        "version": "0.1.0-dev",
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 class AttestationResponse(BaseModel):
@@ -75,8 +102,10 @@ class AttestationResponse(BaseModel):
     manifest: AttestationManifest
 
 
+# Endpoints that block on the sandbox or LLM gateway are plain ``def`` so FastAPI
+# runs them in its worker threadpool instead of stalling the event loop.
 @app.post("/verify")
-async def verify(req: VerifyRequest) -> AttestationResponse:
+def verify(req: VerifyRequest) -> AttestationResponse:
     """Submit code for local sandbox verification and return proof artifact."""
     result = run_in_sandbox(
         code=req.code,
@@ -86,12 +115,12 @@ async def verify(req: VerifyRequest) -> AttestationResponse:
     )
     manifest = build_manifest(result=result)
     assert_manifest_complete(manifest)
-    _MANIFEST_STORE[req.request_id] = manifest
+    _MANIFEST_STORE.put(req.request_id, manifest)
     return AttestationResponse(result=result, manifest=manifest)
 
 
 @app.post("/intercept")
-async def intercept(req: InterceptRequest) -> InterceptorResponse:
+def intercept(req: InterceptRequest) -> InterceptorResponse:
     """Run governance + cloud generation + extraction + sandbox verification."""
     service = InterceptorService(
         model_name=req.model_name,
@@ -117,9 +146,10 @@ async def intercept(req: InterceptRequest) -> InterceptorResponse:
 async def get_manifest(request_id: str) -> AttestationManifest:
     """Retrieve the attestation manifest for a completed request.
 
-    Returns 404 when no manifest has been stored for *request_id*.
-    Manifests are stored in-process; they survive only for the lifetime
-    of the server process (sufficient for v0.1 single-node deployments).
+    Returns 404 when no manifest has been stored for *request_id*, or when it
+    has been evicted. Manifests are stored in-process; they survive only for
+    the lifetime of the server process (sufficient for v0.1 single-node
+    deployments), and only the most recent ``DHI_MANIFEST_CACHE_SIZE`` are kept.
     """
     manifest = _MANIFEST_STORE.get(request_id)
     if manifest is None:
@@ -148,10 +178,14 @@ class OrchestrateRequest(BaseModel):
     llm_top_p: float | None = Field(default=None, gt=0.0, le=1.0)
 
 
-@app.post("/orchestrate")
-async def orchestrate(req: OrchestrateRequest) -> OrchestrationResult:
-    """Run the full autonomous retry circuit breaker (up to 3 attempts)."""
-    service = OrchestratorService(
+class OrchestrateSubmitResponse(BaseModel):
+    """Handle returned by /orchestrate/submit for polling the job."""
+
+    job_id: str
+
+
+def _build_orchestrator(req: OrchestrateRequest) -> OrchestratorService:
+    return OrchestratorService(
         model_name=req.model_name,
         llm_provider=req.llm_provider,
         llm_api_base=req.llm_api_base,
@@ -165,9 +199,58 @@ async def orchestrate(req: OrchestrateRequest) -> OrchestrationResult:
         ledger=_VEIL_LEDGER,
         baseline_fingerprint=_VEIL_BASELINE_FINGERPRINT,
     )
+
+
+@app.post("/orchestrate")
+def orchestrate(req: OrchestrateRequest) -> OrchestrationResult:
+    """Run the full autonomous retry circuit breaker (up to 3 attempts)."""
+    service = _build_orchestrator(req)
     return service.run(
         request_id=req.request_id,
         content=req.content,
         files=req.files,
         mode=req.mode,
     )
+
+
+@app.post("/orchestrate/submit")
+async def submit_orchestration(req: OrchestrateRequest) -> OrchestrateSubmitResponse:
+    """Queue the circuit breaker loop and return a job ID without waiting for it.
+
+    At most ``DHI_ORCH_WORKERS`` queued orchestrations run concurrently; poll
+    ``/orchestrate/result/{job_id}`` for the outcome. Returns 503 when too many
+    orchestrations are already pending.
+    """
+    service = _build_orchestrator(req)
+    try:
+        job_id = _ORCHESTRATION_JOBS.submit(
+            partial(
+                service.run,
+                request_id=req.request_id,
+                content=req.content,
+                files=req.files,
+                mode=req.mode,
+            )
+        )
+    except JobQueueFullError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=str(exc),
+            headers={"Retry-After": "5"},
+        ) from exc
+    return OrchestrateSubmitResponse(job_id=job_id)
+
+
+@app.get("/orchestrate/result/{job_id}")
+async def get_orchestration(job_id: str) -> OrchestrationJob:
+    """Return the status, and once finished the result, of a submitted orchestration.
+
+    Returns 404 for unknown job IDs and for jobs old enough to have been dropped.
+    """
+    job = _ORCHESTRATION_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No orchestration job found for job_id='{job_id}'",
+        )
+    return job
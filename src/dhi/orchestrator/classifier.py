@@ -28,6 +28,8 @@ MAX_ATTEMPTS = 3
 class RetryDecision:
     """Encapsulates a retry eligibility decision with its reason."""
 
+    __slots__ = ("should_retry", "reason")
+
     def __init__(self, *, should_retry: bool, reason: str) -> None:
         self.should_retry = should_retry
         self.reason = reason
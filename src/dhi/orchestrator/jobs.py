@@ -0,0 +1,131 @@
+"""In-process job queue decoupling orchestration submits from their execution."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+from .models import OrchestrationJob, OrchestrationResult
+
+logger = logging.getLogger(__name__)
+
+# Jobs allowed to wait or run per worker before new submits are rejected.
+_PENDING_JOBS_PER_WORKER = 4
+
+
+class JobQueueFullError(Exception):
+    """Raised when a submit would exceed the queue's pending-job bound."""
+
+
+class OrchestrationJobQueue:
+    """Runs orchestrations on a bounded worker pool and keeps recent jobs for polling.
+
+    At most *max_workers* orchestrations execute at once and at most
+    *max_pending* (by default four per worker) may be queued or running; further
+    submits raise ``JobQueueFullError``. Finished jobs stay pollable until more
+    than *max_jobs* are held, the oldest finished job being forgotten first;
+    pending jobs are never dropped. Failed jobs report only the exception type;
+    the full exception is logged. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_jobs: int = 10_000,
+        max_pending: int | None = None,
+    ) -> None:
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be >= 1")
+        if max_pending is None:
+            max_pending = max_workers * _PENDING_JOBS_PER_WORKER
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self._max_workers = max_workers
+        self._executor = self._new_executor()
+        self._max_jobs = max_jobs
+        self._max_pending = max_pending
+        self._pending = 0
+        self._jobs: OrderedDict[str, Future[OrchestrationResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, run: Callable[[], OrchestrationResult]) -> str:
+        """Schedule *run* on the worker pool and return its job ID.
+
+        Raises ``JobQueueFullError`` when *max_pending* jobs are already queued
+        or running.
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            if self._pending >= self._max_pending:
+                raise JobQueueFullError(f"{self._pending} orchestration jobs already pending")
+            future = self._executor.submit(run)
+            self._pending += 1
+            self._jobs[job_id] = future
+            if len(self._jobs) > self._max_jobs:
+                self._forget_oldest_finished()
+        # Registered outside the lock: the callback runs inline if *run* already finished.
+        future.add_done_callback(partial(self._on_done, job_id))
+        return job_id
+
+    def get(self, job_id: str) -> OrchestrationJob | None:
+        """Return the current state of *job_id*, or ``None`` if unknown or forgotten."""
+        with self._lock:
+            future = self._jobs.get(job_id)
+        if future is None:
+            return None
+        if not future.done():
+            return OrchestrationJob(job_id=job_id, status="pending")
+        if future.cancelled():
+            return OrchestrationJob(job_id=job_id, status="failed", error="cancelled")
+
+        exc = future.exception()
+        if exc is not None:
+            return OrchestrationJob(
+                job_id=job_id,
+                status="failed",
+                error=type(exc).__name__,
+            )
+        return OrchestrationJob(job_id=job_id, status="completed", result=future.result())
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and wait for running ones to finish.
+
+        The queue stays usable: later submits run on a fresh worker pool, so an
+        app can go through several startup/shutdown cycles in one process.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = self._new_executor()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="dhi-orchestrate",
+        )
+
+    def _on_done(self, job_id: str, future: Future[OrchestrationResult]) -> None:
+        with self._lock:
+            self._pending -= 1
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Orchestration job %s failed", job_id, exc_info=exc)
+
+    def _forget_oldest_finished(self) -> None:
+        # Called with the lock held. At most max_pending jobs are unfinished, so
+        # the scan stops within the first max_pending + 1 entries.
+        for job_id, future in self._jobs.items():
+            if future.done():
+                del self._jobs[job_id]
+                return
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -16,7 +18,7 @@ class AttemptRecord(BaseModel):
     extraction_success: bool
     extraction_error: str | None = None
     verification_result: VerificationResult | None = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=partial(datetime.now, timezone.utc))
 
 
 class OrchestrationResult(BaseModel):
@@ -40,3 +42,12 @@ class OrchestrationResult(BaseModel):
         default_factory=list,
         description="Full history of all attempts made",
     )
+
+
+class OrchestrationJob(BaseModel):
+    """Polling view of an orchestration submitted for background execution."""
+
+    job_id: str
+    status: Literal["pending", "completed", "failed"]
+    result: OrchestrationResult | None = None
+    error: str | None = None
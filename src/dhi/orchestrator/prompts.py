@@ -8,29 +8,59 @@ from dhi.sandbox.models import FailureClass, VerificationResult
 _MAX_OUTPUT_CHARS = 2_000
 
 
+_REPAIR_PROMPT_TEMPLATE = (
+    "## PREVIOUS ATTEMPT FAILED - REPAIR REQUIRED\n"
+    "\n"
+    "**Failure class:** {failure_class}\n"
+    "**Attempt number:** {attempt}\n"
+    "\n"
+    "### Guidance\n"
+    "{guidance}\n"
+    "\n"
+    "{stdout_block}"
+    "{stderr_block}"
+    "---\n"
+    "\n"
+    "## Original Request\n"
+    "{original}"
+)
+
+_OUTPUT_BLOCK_TEMPLATE = "### Captured {stream}\n```\n{text}\n```\n\n"
+
+
 def _truncate(text: str, limit: int = _MAX_OUTPUT_CHARS) -> str:
-    if len(text) <= limit:
-        return text
-    return text[:limit] + "\n...[TRUNCATED]"
+    return text if len(text) <= limit else f"{text[:limit]}\n...[TRUNCATED]"
+
+
+def _output_block(stream: str, text: str) -> str:
+    """Return the fenced section for captured *text*, or ``""`` when it is blank."""
+    if not text or text.isspace():
+        return ""
+    return _OUTPUT_BLOCK_TEMPLATE.format(stream=stream, text=_truncate(text))
+
+
+_GUIDANCE: dict[FailureClass, str] = {
+    FailureClass.syntax: (
+        "The previous code had a SYNTAX ERROR. "
+        "Review the error output carefully and emit clean, syntactically valid Python."
+    ),
+    FailureClass.deterministic: (
+        "The previous code produced a DETERMINISTIC LOGICAL FAILURE "
+        "(consistent wrong output or exception). "
+        "Do not change the overall approach - instead fix the specific "
+        "logical error shown in the error output."
+    ),
+}
+
+_DEFAULT_GUIDANCE = (
+    "The previous attempt failed. Analyze the error output and produce a corrected solution."
+)
 
 
 def _failure_guidance(failure_class: FailureClass | None) -> str:
-    guidance = {
-        FailureClass.syntax: (
-            "The previous code had a SYNTAX ERROR. "
-            "Review the error output carefully and emit clean, syntactically valid Python."
-        ),
-        FailureClass.deterministic: (
-            "The previous code produced a DETERMINISTIC LOGICAL FAILURE "
-            "(consistent wrong output or exception). "
-            "Do not change the overall approach - instead fix the specific "
-            "logical error shown in the error output."
-        ),
-    }
-    return guidance.get(
-        failure_class,  # type: ignore[arg-type]
-        "The previous attempt failed. Analyze the error output and produce a corrected solution.",
-    )
+    if failure_class is None:
+        return _DEFAULT_GUIDANCE
+    return _GUIDANCE.get(failure_class, _DEFAULT_GUIDANCE)
 
 
 def build_repair_prompt(
@@ -43,42 +73,11 @@ def build_repair_prompt(
 
     The generated string replaces the `content` field of a ``ContextPayload`` on retry.
     """
-    guidance = _failure_guidance(last_result.failure_class)
-
-    sections: list[str] = [
-        "## PREVIOUS ATTEMPT FAILED - REPAIR REQUIRED",
-        "",
-        f"**Failure class:** {last_result.failure_class or 'unknown'}",
-        f"**Attempt number:** {last_result.attempt}",
-        "",
-        "### Guidance",
-        guidance,
-        "",
-    ]
-
-    if last_result.stdout.strip():
-        sections += [
-            "### Captured stdout",
-            "```",
-            _truncate(last_result.stdout),
-            "```",
-            "",
-        ]
-
-    if last_result.stderr.strip():
-        sections += [
-            "### Captured stderr",
-            "```",
-            _truncate(last_result.stderr),
-            "```",
-            "",
-        ]
-
-    sections += [
-        "---",
-        "",
-        "## Original Request",
-        original_content,
-    ]
-
-    return "\n".join(sections)
+    return _REPAIR_PROMPT_TEMPLATE.format(
+        failure_class=last_result.failure_class or "unknown",
+        attempt=last_result.attempt,
+        guidance=_failure_guidance(last_result.failure_class),
+        stdout_block=_output_block("stdout", last_result.stdout),
+        stderr_block=_output_block("stderr", last_result.stderr),
+        original=original_content,
+    )
@@ -23,11 +23,12 @@ from .prompts import build_repair_prompt
 
 logger = logging.getLogger(__name__)
 
-
 def _is_retryable_extraction_syntax_error(error: str | None) -> bool:
     if error is None:
         return False
-    return "syntaxerror" in error.lower()
+    # The extractor reports syntax failures as "SyntaxError at line ...", so the
+    # common case is decided without lowercasing the whole message.
+    return error.startswith("SyntaxError") or "syntaxerror" in error.lower()
 
 
 def _synthetic_syntax_failure(
@@ -198,7 +199,9 @@ class OrchestratorService:
             )
 
         attempt_count = len(attempts)
-        result = OrchestrationResult(
+        # Every field is produced by the loop above (attempt_count is bounded by
+        # MAX_ATTEMPTS), so the aggregate is built without re-validating records.
+        result = OrchestrationResult.model_construct(
             request_id=request_id,
             attempt_count=attempt_count,
             retry_count=attempt_count - 1,
@@ -208,8 +211,10 @@ class OrchestratorService:
         )
 
         if self._ledger is not None and self._gate is not None:
-            baseline = self._baseline or EnvironmentFingerprint.generate()
+            # Regenerated per run so drift is never masked; the file hashes behind
+            # it are memoized on their stat snapshot, so this stays cheap.
             current_fp = EnvironmentFingerprint.generate()
+            baseline = self._baseline or current_fp
             gate_decision = self._gate.evaluate(result, current_fp, baseline)
             self._ledger.write(gate_decision, result, current_fp)
 
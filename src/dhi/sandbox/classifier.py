@@ -8,6 +8,61 @@ known signals and error strings.
 
 from dhi.sandbox.models import FailureClass, ViolationEvent
 
+# Policy signals in priority order (4-7); the first category with a match wins.
+_POLICY_SIGNALS: tuple[tuple[ViolationEvent, tuple[str, ...]], ...] = (
+    # Priority 4: network access violation
+    (
+        ViolationEvent.NetworkAccessViolation,
+        (
+            "network is unreachable",
+            "name or service not known",
+            "connection refused",
+            "socket.gaierror",
+            "errno 101",  # ENETUNREACH
+            "errno 111",  # ECONNREFUSED
+            "[errno 110]",  # ETIMEDOUT
+        ),
+    ),
+    # Priority 5: filesystem write violation
+    (
+        ViolationEvent.FilesystemWriteViolation,
+        (
+            "read-only file system",
+            "[errno 30]",
+            "erofs",
+        ),
+    ),
+    # Priority 6: process limit violation
+    (
+        ViolationEvent.ProcessLimitViolation,
+        (
+            "resource temporarily unavailable",
+            "can't start new thread",
+            "cannot allocate memory",
+            "fork: retry",
+            "pids limit",
+        ),
+    ),
+    # Priority 7: syscall/seccomp violation
+    (
+        ViolationEvent.SyscallViolation,
+        (
+            "seccomp",
+            "operation not permitted",
+            "permission denied",
+            "bad system call",
+        ),
+    ),
+)
+
+_OOM_SIGNALS = ("killed", "out of memory")
+
+_SYNTAX_SIGNALS = ("syntaxerror", "indentationerror")
+
+
+def _contains_any(streams: tuple[str, ...], signals: tuple[str, ...]) -> bool:
+    return any(sig in text for text in streams for sig in signals)
+
 
 def classify(
     *,
@@ -46,59 +101,23 @@ def classify(
 
     stderr_lower = stderr.lower()
     stdout_lower = stdout.lower()
-    combined = stderr_lower + stdout_lower
-
-    # Priority 4: network access violation
-    network_signals = (
-        "network is unreachable",
-        "name or service not known",
-        "connection refused",
-        "socket.gaierror",
-        "errno 101",  # ENETUNREACH
-        "errno 111",  # ECONNREFUSED
-        "[errno 110]",  # ETIMEDOUT
-    )
-    if any(sig in combined for sig in network_signals):
-        return ViolationEvent.NetworkAccessViolation, FailureClass.policy
-
-    # Priority 5: filesystem write violation
-    fs_signals = (
-        "read-only file system",
-        "[errno 30]",
-        "erofs",
-    )
-    if any(sig in combined for sig in fs_signals):
-        return ViolationEvent.FilesystemWriteViolation, FailureClass.policy
-
-    # Priority 6: process limit violation
-    process_limit_signals = (
-        "resource temporarily unavailable",
-        "can't start new thread",
-        "cannot allocate memory",
-        "fork: retry",
-        "pids limit",
-    )
-    if any(sig in combined for sig in process_limit_signals):
-        return ViolationEvent.ProcessLimitViolation, FailureClass.policy
+    # Each stream is scanned separately rather than concatenated, which would
+    # copy up to twice the log cap just to search it.
+    streams = (stderr_lower, stdout_lower)
 
-    # Priority 7: syscall/seccomp violation
-    syscall_signals = (
-        "seccomp",
-        "operation not permitted",
-        "permission denied",
-        "bad system call",
-    )
-    if any(sig in combined for sig in syscall_signals):
-        return ViolationEvent.SyscallViolation, FailureClass.policy
+    # Priorities 4-7: policy violations signalled in the output streams
+    for violation, signals in _POLICY_SIGNALS:
+        if _contains_any(streams, signals):
+            return violation, FailureClass.policy
 
     # Priority 8: memory limit (OOM kill)
     if exit_code == 137 and (
-        "killed" in combined or "out of memory" in combined or not stderr.strip()
+        _contains_any(streams, _OOM_SIGNALS) or not stderr.strip()
     ):
         return ViolationEvent.MemoryLimitViolation, FailureClass.policy
 
     # Priority 9: Python syntax error
-    if "syntaxerror" in stderr_lower or "indentationerror" in stderr_lower:
+    if any(sig in stderr_lower for sig in _SYNTAX_SIGNALS):
         return None, FailureClass.syntax
 
     # Priority 10: generic deterministic failure
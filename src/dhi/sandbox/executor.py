@@ -7,13 +7,17 @@ policy defaults from the runtime spec.
 
 from __future__ import annotations
 
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
 
 import docker  # type: ignore[import-untyped]
 import docker.errors  # type: ignore[import-untyped]
 
+from dhi.env import positive_int_env
 from dhi.sandbox.classifier import classify
 from dhi.sandbox.models import (
     FailureClass,
@@ -37,8 +41,66 @@ _SANDBOX_IMAGE = "dhi-sandbox:latest"
 _SOURCE_PATH = "/source"
 _SCRATCH_PATH = "/tmp/dhi-scratch"
 
+# Caps concurrent sandbox runs per process now that API requests execute in a
+# threadpool; callers beyond the cap wait for a free slot.
+_SANDBOX_SLOTS = threading.BoundedSemaphore(positive_int_env("DHI_SANDBOX_WORKERS", 8))
+
+# Shared Docker client so runs reuse its HTTP connection pool; the daemon is
+# re-pinged at most once per interval to keep failing fast when it goes away.
+_DOCKER_PING_INTERVAL_S = 30.0
+_docker_client: Any = None
+_docker_last_ping = 0.0
+_docker_client_lock = threading.Lock()
+
+# An established client reports a lost daemon connection as a raw requests
+# error rather than a DockerException. The class is taken from docker's own
+# namespace so requests stays a transitive dependency of docker.
+_RequestException = docker.errors.requests.exceptions.RequestException
+_DOCKER_UNAVAILABLE_ERRORS = (docker.errors.DockerException, _RequestException)
+
+
+def _get_docker_client() -> Any:
+    """Return the shared Docker client, creating or re-pinging it when due.
+
+    Raises one of ``_DOCKER_UNAVAILABLE_ERRORS`` when the daemon is unreachable;
+    a client whose ping fails is discarded so the next run reconnects.
+    """
+    global _docker_client, _docker_last_ping
+
+    with _docker_client_lock:
+        now = time.monotonic()
+        if _docker_client is None:
+            client = docker.from_env()
+            # Fail fast if daemon is unreachable.
+            client.ping()
+            _docker_client = client
+            _docker_last_ping = now
+        elif now - _docker_last_ping >= _DOCKER_PING_INTERVAL_S:
+            try:
+                _docker_client.ping()
+            except _DOCKER_UNAVAILABLE_ERRORS:
+                _docker_client = None
+                raise
+            _docker_last_ping = now
+        return _docker_client
+
+
+def _discard_docker_client(client: Any) -> None:
+    """Drop *client* as the shared client so the next run reconnects."""
+    global _docker_client
+
+    with _docker_client_lock:
+        if _docker_client is client:
+            _docker_client = None
 
+
+@lru_cache(maxsize=len(VerificationMode))
 def _base_runtime_config(mode: VerificationMode) -> dict[str, object]:
+    """Return the runtime policy snapshot for *mode*, built once per mode.
+
+    The cached dict must not be mutated; ``VerificationResult`` validation
+    copies it, so results never share it.
+    """
     return {
         "mode": mode.value,
         "timeout_s": _BALANCED_TIMEOUT_S,
@@ -89,7 +151,27 @@ def run_in_sandbox(
     attempt: int,
     mode: VerificationMode = VerificationMode.balanced,
 ) -> VerificationResult:
-    """Execute candidate code in the balanced sandbox and return verification result."""
+    """Execute candidate code in the balanced sandbox and return verification result.
+
+    At most ``DHI_SANDBOX_WORKERS`` runs execute concurrently; time spent waiting
+    for a slot does not count toward the run's duration or budget.
+    """
+    with _SANDBOX_SLOTS:
+        return _run_in_sandbox_slot(
+            code=code,
+            request_id=request_id,
+            attempt=attempt,
+            mode=mode,
+        )
+
+
+def _run_in_sandbox_slot(
+    *,
+    code: str,
+    request_id: str,
+    attempt: int,
+    mode: VerificationMode,
+) -> VerificationResult:
     runtime_config = _base_runtime_config(mode)
     start_monotonic = time.monotonic()
 
@@ -106,10 +188,8 @@ def run_in_sandbox(
         )
 
     try:
-        client = docker.from_env()
-        # Fail fast if daemon is unreachable.
-        client.ping()
-    except docker.errors.DockerException as exc:
+        client = _get_docker_client()
+    except _DOCKER_UNAVAILABLE_ERRORS as exc:
         return _failure_result(
             request_id=request_id,
             attempt=attempt,
@@ -164,26 +244,31 @@ def run_in_sandbox(
                 timed_out = True
 
             try:
-                raw_stdout = container.logs(stdout=True, stderr=False)
-                raw_stderr = container.logs(stdout=False, stderr=True)
-                output_capped = (
-                    len(raw_stdout) > _BALANCED_LOG_CAP
-                    or len(raw_stderr) > _BALANCED_LOG_CAP
+                raw_stdout = _read_log_stream(container, stdout=True)
+                raw_stderr = _read_log_stream(container, stdout=False)
+                stdout_capped = len(raw_stdout) > _BALANCED_LOG_CAP
+                stderr_capped = len(raw_stderr) > _BALANCED_LOG_CAP
+                output_capped = stdout_capped or stderr_capped
+                # Capped streams are summarized from a short preview; decoding
+                # the full capped prefix first would be thrown away.
+                stdout = (
+                    _summarize_capped_stream(raw_stdout, stream_name="stdout")
+                    if stdout_capped
+                    else _decode_stream(raw_stdout)
+                )
+                stderr = (
+                    _summarize_capped_stream(raw_stderr, stream_name="stderr")
+                    if stderr_capped
+                    else _decode_stream(raw_stderr)
                 )
-                stdout = _decode_stream(raw_stdout)
-                stderr = _decode_stream(raw_stderr)
-
-                if len(raw_stdout) > _BALANCED_LOG_CAP:
-                    stdout = _summarize_capped_stream(raw_stdout, stream_name="stdout")
-                if len(raw_stderr) > _BALANCED_LOG_CAP:
-                    stderr = _summarize_capped_stream(raw_stderr, stream_name="stderr")
-            except docker.errors.DockerException:
+            except _DOCKER_UNAVAILABLE_ERRORS:
+                # The container already ran; keep its exit code and report the logs lost.
                 stdout = ""
                 stderr = "Failed to retrieve container logs."
             finally:
                 try:
                     container.remove(force=True)
-                except docker.errors.DockerException:
+                except _DOCKER_UNAVAILABLE_ERRORS:
                     pass
 
         except docker.errors.ImageNotFound:
@@ -207,6 +292,18 @@ def run_in_sandbox(
                 start_monotonic=start_monotonic,
                 stderr=f"Sandbox runtime failure: {exc}",
             )
+        except _RequestException as exc:
+            # The connection to the daemon was lost before the container finished.
+            _discard_docker_client(client)
+            return _failure_result(
+                request_id=request_id,
+                attempt=attempt,
+                mode=mode,
+                runtime_config=runtime_config,
+                start_monotonic=start_monotonic,
+                stderr=f"Docker daemon unavailable: {exc}",
+                terminal_event=ViolationEvent.StrictModeUnavailable,
+            )
 
     elapsed_ms = int((time.monotonic() - start_monotonic) * 1000)
 
@@ -240,15 +337,37 @@ def run_in_sandbox(
     )
 
 
+def _read_log_stream(container: Any, *, stdout: bool) -> bytes:
+    """Stream one of the container's log streams with bounded memory and transfer.
+
+    Returns at most the first ``_BALANCED_LOG_CAP + 1`` bytes; a result longer
+    than the cap means the stream was capped. Reading stops, and the stream is
+    closed, as soon as that many bytes are kept, so the rest of an oversized
+    stream is never pulled from the daemon.
+    """
+    limit = _BALANCED_LOG_CAP + 1
+    kept = bytearray()
+    stream = container.logs(stdout=stdout, stderr=not stdout, stream=True, follow=False)
+    try:
+        for chunk in stream:
+            kept += chunk[: limit - len(kept)]
+            if len(kept) >= limit:
+                break
+    finally:
+        stream.close()
+    return bytes(kept)
+
+
 def _decode_stream(raw: bytes) -> str:
     return raw[:_BALANCED_LOG_CAP].decode("utf-8", errors="replace")
 
 
 def _summarize_capped_stream(raw: bytes, *, stream_name: str) -> str:
     preview = raw[:_CAPPED_LOG_PREVIEW_BYTES].decode("utf-8", errors="replace")
+    # Reading stops just past the cap, so only a lower bound on the size is known.
     return (
         f"{preview}\n\n"
         f"[TRUNCATED_{stream_name.upper()} "
-        f"original_bytes={len(raw)} cap_bytes={_BALANCED_LOG_CAP} "
+        f"original_bytes_min={len(raw)} cap_bytes={_BALANCED_LOG_CAP} "
         f"preview_bytes={_CAPPED_LOG_PREVIEW_BYTES}]"
     )
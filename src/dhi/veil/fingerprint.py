@@ -4,22 +4,34 @@ from __future__ import annotations
 
 import hashlib
 import os
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict
 
 
+@lru_cache(maxsize=32)
+def _sha256_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Hash *path*; memoized on its ``(mtime_ns, size)`` snapshot."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def _sha256_file(filepath: Path | str) -> str:
-    """Compute SHA-256 of a file, returning empty string if it doesn't exist."""
-    path = Path(filepath)
-    if not path.is_file():
+    """Compute SHA-256 of a file, returning empty string if it doesn't exist.
+
+    Unchanged files are not re-read: digests are cached per path and
+    ``(st_mtime_ns, st_size)``.
+    """
+    try:
+        file_stat = os.stat(filepath)
+    except (OSError, ValueError):
         return ""
-    hasher = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    if not stat.S_ISREG(file_stat.st_mode):
+        return ""
+    return _sha256_file_cached(str(filepath), file_stat.st_mtime_ns, file_stat.st_size)
 
 
 def _sha256_string(s: str) -> str:
@@ -27,6 +39,12 @@ def _sha256_string(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=1)
+def _environ_names_hash(names: frozenset[str]) -> str:
+    """Hash the sorted environment variable *names*; memoized while they are unchanged."""
+    return _sha256_string("\n".join(sorted(names)))
+
+
 class EnvironmentFingerprint(BaseModel):
     """
     Deterministic snapshot of the environment that produced a run.
@@ -68,10 +86,10 @@ class EnvironmentFingerprint(BaseModel):
         cmd_hash = _sha256_string(cmd_blob)
 
         # Hash JUST the names of the env vars, not their values (which might contain secrets)
-        env_vars = allowed_env_vars or list(os.environ.keys())
-        env_vars_sorted = sorted(env_vars)
-        env_blob = "\n".join(env_vars_sorted)
-        env_hash = _sha256_string(env_blob)
+        if allowed_env_vars:
+            env_hash = _sha256_string("\n".join(sorted(allowed_env_vars)))
+        else:
+            env_hash = _environ_names_hash(frozenset(os.environ))
 
         return cls(
             runtime_image_digest=image_digest,
@@ -2,24 +2,42 @@
 
 from __future__ import annotations
 
+import sys
+from collections import deque
 from datetime import datetime, timezone
+from functools import partial
+from typing import IO, Any
+
+from pydantic import TypeAdapter
 
 from dhi.orchestrator.models import OrchestrationResult
 from dhi.sandbox.models import FailureClass
 from dhi.veil.fingerprint import EnvironmentFingerprint
 from dhi.veil.models import BehavioralEvent, GateDecision, TelemetryEvent
 
+_utcnow = partial(datetime.now, timezone.utc)
+
+# Built once: batch export serializes whole streams straight to JSON in pydantic-core.
+_TELEMETRY_ADAPTER: TypeAdapter[list[TelemetryEvent]] = TypeAdapter(list[TelemetryEvent])
+_BEHAVIORAL_ADAPTER: TypeAdapter[list[BehavioralEvent]] = TypeAdapter(list[BehavioralEvent])
+_BEHAVIORAL_EVENT_ADAPTER: TypeAdapter[BehavioralEvent] = TypeAdapter(BehavioralEvent)
+
 
 class VeilLedger:
     """
-    In-process, list-backed event store for VEIL.
+    In-process, deque-backed event store for VEIL.
     Writes telemetry for all runs, and behavioral events only for runs
     that pass the Determinism Gate.
+
+    When *max_events* is set, each stream keeps only its most recent
+    *max_events* events, dropping the oldest first.
     """
 
-    def __init__(self) -> None:
-        self._telemetry: list[TelemetryEvent] = []
-        self._behavioral: list[BehavioralEvent] = []
+    def __init__(self, max_events: int | None = None) -> None:
+        if max_events is not None and max_events < 1:
+            raise ValueError("max_events must be >= 1")
+        self._telemetry: deque[TelemetryEvent] = deque(maxlen=max_events)
+        self._behavioral: deque[BehavioralEvent] = deque(maxlen=max_events)
 
     def write(
         self,
@@ -32,46 +50,42 @@ class VeilLedger:
         Always records Telemetry.
         Records Behavioral memory if `decision.passed` is True.
         """
-        now = datetime.now(timezone.utc)
+        now = _utcnow()
         
-        # Extract fields from the last attempt if available
+        # Sum sandbox wall-clock time across attempts and take the failure
+        # class of the final attempt, in a single pass over the attempts.
         failure_class: FailureClass | None = None
         duration_ms = 0
-        if result.attempts:
-            # sum durations to get total wall-clock time in sandbox
-            duration_ms = sum(
-                a.verification_result.duration_ms
-                for a in result.attempts
-                if a.verification_result
-            )
-            # get the final failure class
-            last_verif = result.attempts[-1].verification_result
-            if last_verif:
-                failure_class = last_verif.failure_class
+        verification = None
+        for attempt in result.attempts:
+            verification = attempt.verification_result
+            if verification is not None:
+                duration_ms += verification.duration_ms
+        if verification is not None:
+            failure_class = verification.failure_class
+
+        # Every field comes from an already-validated OrchestrationResult, so the
+        # events are built with model_construct instead of being re-validated.
+        # Both events share the same base fields, gathered once. The outcome is
+        # interned so retained events share one "pass"/"fail" string even when
+        # the result was deserialized rather than built in-process.
+        common_fields: dict[str, Any] = {
+            "request_id": result.request_id,
+            "timestamp": now,
+            "outcome": sys.intern(result.final_status),
+            "failure_class": failure_class,
+            "attempt_count": result.attempt_count,
+            "duration_ms": duration_ms,
+        }
 
         # 1. Always write Telemetry
-        telemetry_event = TelemetryEvent(
-            request_id=result.request_id,
-            timestamp=now,
-            outcome=result.final_status,
-            failure_class=failure_class,
-            attempt_count=result.attempt_count,
-            duration_ms=duration_ms,
-        )
-        self._telemetry.append(telemetry_event)
+        self._telemetry.append(TelemetryEvent.model_construct(**common_fields))
 
         # 2. Conditionally write Behavioral Memory
         if decision.passed:
-            behavioral_event = BehavioralEvent(
-                request_id=result.request_id,
-                timestamp=now,
-                outcome=result.final_status,
-                failure_class=failure_class,
-                attempt_count=result.attempt_count,
-                duration_ms=duration_ms,
-                fingerprint=fingerprint,
+            self._behavioral.append(
+                BehavioralEvent.model_construct(**common_fields, fingerprint=fingerprint)
             )
-            self._behavioral.append(behavioral_event)
 
     def read_telemetry(self) -> list[TelemetryEvent]:
         """Return all recorded telemetry events."""
@@ -80,3 +94,21 @@ class VeilLedger:
     def read_behavioral(self) -> list[BehavioralEvent]:
         """Return all recorded behavioral memory events."""
         return list(self._behavioral)
+
+    def dump_telemetry_json(self) -> bytes:
+        """Return all recorded telemetry events as a single JSON array."""
+        return _TELEMETRY_ADAPTER.dump_json(list(self._telemetry))
+
+    def dump_behavioral_json(self) -> bytes:
+        """Return all recorded behavioral memory events as a single JSON array."""
+        return _BEHAVIORAL_ADAPTER.dump_json(list(self._behavioral))
+
+    def flush_jsonl(self, fp: IO[bytes]) -> int:
+        """
+        Write behavioral memory events to *fp* as JSON Lines.
+        Events stay in the ledger; returns the number of events written.
+        """
+        events = list(self._behavioral)
+        dump_json = _BEHAVIORAL_EVENT_ADAPTER.dump_json
+        fp.writelines(dump_json(event) + b"\n" for event in events)
+        return len(events)
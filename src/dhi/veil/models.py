@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from dhi.sandbox.models import FailureClass
 from dhi.veil.fingerprint import EnvironmentFingerprint
@@ -22,13 +22,20 @@ class VeilEventType(str, Enum):
 class GateDecision(BaseModel):
     """The result of evaluating a run through the Determinism Gate."""
 
+    model_config = ConfigDict(frozen=True)
+
     passed: bool
     reason: str
     reproducible: bool
 
 
 class _BaseVeilEvent(BaseModel):
-    """Common fields for all VEIL events."""
+    """Common fields for all VEIL events.
+
+    Events are immutable once recorded; the ledger hands out shared references.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     request_id: str
     timestamp: datetime
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import ast
+from unittest.mock import patch
+
 from dhi.interceptor.extractor import extract_candidate, validate_python_code
 
 
@@ -20,6 +23,14 @@ def test_validate_python_code_empty() -> None:
     assert validate_python_code("   \n") is not None
 
 
+def test_validate_python_code_memoizes_repeated_candidates() -> None:
+    code = "def memoized_candidate():\n    return 7"
+    with patch("dhi.interceptor.extractor.ast.parse", wraps=ast.parse) as spy:
+        assert validate_python_code(code) is None
+        assert validate_python_code(code) is None
+    assert spy.call_count == 1
+
+
 def test_extract_candidate_valid_json() -> None:
     response = """
     {
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from dhi.orchestrator.jobs import JobQueueFullError, OrchestrationJobQueue
+from dhi.orchestrator.models import OrchestrationJob, OrchestrationResult
+
+
+def _result(request_id: str = "req-job") -> OrchestrationResult:
+    return OrchestrationResult(
+        request_id=request_id,
+        attempt_count=1,
+        retry_count=0,
+        final_status="pass",
+    )
+
+
+def _wait_for(queue: OrchestrationJobQueue, job_id: str) -> OrchestrationJob:
+    deadline = time.monotonic() + 5
+    while True:
+        job = queue.get(job_id)
+        assert job is not None
+        if job.status != "pending":
+            return job
+        assert time.monotonic() < deadline, f"job {job_id} did not finish"
+        time.sleep(0.01)
+
+
+def test_job_reports_pending_then_completed() -> None:
+    queue = OrchestrationJobQueue(max_workers=1)
+    release = threading.Event()
+
+    def run() -> OrchestrationResult:
+        release.wait(timeout=5)
+        return _result()
+
+    job_id = queue.submit(run)
+    pending = queue.get(job_id)
+    assert pending is not None
+    assert pending.status == "pending"
+    assert pending.result is None
+
+    release.set()
+    completed = _wait_for(queue, job_id)
+    assert completed.status == "completed"
+    assert completed.result is not None
+    assert completed.result.request_id == "req-job"
+
+
+def test_job_failure_reports_exception_type_only(caplog: pytest.LogCaptureFixture) -> None:
+    queue = OrchestrationJobQueue(max_workers=1)
+
+    def run() -> OrchestrationResult:
+        raise RuntimeError("gateway down at /srv/internal/keys.env")
+
+    job_id = queue.submit(run)
+    job = _wait_for(queue, job_id)
+    assert job.status == "failed"
+    assert job.error == "RuntimeError"
+
+    queue.shutdown()
+    assert "gateway down" in caplog.text
+
+
+def test_unknown_job_returns_none() -> None:
+    assert OrchestrationJobQueue().get("missing") is None
+
+
+def test_oldest_finished_job_is_forgotten_when_full() -> None:
+    queue = OrchestrationJobQueue(max_workers=1, max_jobs=2)
+    job_ids = []
+    for _ in range(3):
+        job_id = queue.submit(_result)
+        _wait_for(queue, job_id)
+        job_ids.append(job_id)
+
+    assert len(queue) == 2
+    assert queue.get(job_ids[0]) is None
+    assert queue.get(job_ids[1]) is not None
+    assert queue.get(job_ids[2]) is not None
+
+
+def test_pending_job_is_never_forgotten() -> None:
+    queue = OrchestrationJobQueue(max_workers=1, max_jobs=1)
+    release = threading.Event()
+
+    def run() -> OrchestrationResult:
+        release.wait(timeout=5)
+        return _result()
+
+    first = queue.submit(run)
+    second = queue.submit(_result)
+
+    pending = queue.get(first)
+    assert pending is not None
+    assert pending.status == "pending"
+
+    release.set()
+    assert _wait_for(queue, first).status == "completed"
+    assert _wait_for(queue, second).status == "completed"
+
+
+def test_submit_rejected_when_pending_bound_reached() -> None:
+    queue = OrchestrationJobQueue(max_workers=1, max_pending=2)
+    release = threading.Event()
+
+    def run() -> OrchestrationResult:
+        release.wait(timeout=5)
+        return _result()
+
+    first = queue.submit(run)
+    second = queue.submit(run)
+    with pytest.raises(JobQueueFullError):
+        queue.submit(run)
+
+    release.set()
+    _wait_for(queue, first)
+    _wait_for(queue, second)
+    queue.shutdown()
+
+    # Finished jobs free their slots.
+    for _ in range(2):
+        _wait_for(queue, queue.submit(_result))
+
+
+def test_shutdown_cancels_queued_jobs() -> None:
+    queue = OrchestrationJobQueue(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def run() -> OrchestrationResult:
+        started.set()
+        release.wait(timeout=5)
+        return _result()
+
+    running = queue.submit(run)
+    queued = queue.submit(run)
+    assert started.wait(timeout=5)
+    threading.Timer(0.05, release.set).start()
+    queue.shutdown()
+
+    running_job = queue.get(running)
+    queued_job = queue.get(queued)
+    assert running_job is not None and running_job.status == "completed"
+    assert queued_job is not None and queued_job.status == "failed"
+    assert queued_job.error == "cancelled"
+
+
+def test_queue_accepts_jobs_after_shutdown() -> None:
+    queue = OrchestrationJobQueue(max_workers=1)
+    queue.shutdown()
+
+    job = _wait_for(queue, queue.submit(_result))
+    assert job.status == "completed"
+
+
+def test_rejects_non_positive_max_jobs() -> None:
+    with pytest.raises(ValueError):
+        OrchestrationJobQueue(max_jobs=0)
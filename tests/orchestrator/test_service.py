@@ -254,3 +254,37 @@ class TestOrchestratorService:
         assert len(behavioral) == 0
         assert telemetry[0].request_id == "req-veil-flake"
         assert telemetry[0].failure_class == FailureClass.flake
+
+    def test_veil_fingerprint_drift_detected_between_runs(self) -> None:
+        """Each run fingerprints the environment afresh, so drift between runs is gated."""
+        from dhi.veil.fingerprint import EnvironmentFingerprint
+        from dhi.veil.gate import DeterminismGate
+        from dhi.veil.ledger import VeilLedger
+
+        baseline = EnvironmentFingerprint.generate()
+        drifted = baseline.model_copy(update={"lockfile_hash": "rebuilt"})
+        ledger = VeilLedger()
+        svc = OrchestratorService(
+            gate=DeterminismGate(),
+            ledger=ledger,
+            baseline_fingerprint=baseline,
+        )
+
+        with (
+            patch.object(
+                svc._interceptor,
+                "process_request",
+                return_value=_make_interceptor_response(status="pass", attempt=1),
+            ),
+            patch.object(
+                EnvironmentFingerprint,
+                "generate",
+                side_effect=[baseline, drifted],
+            ) as generate,
+        ):
+            svc.run(request_id="req-fp-1", content="print(1)")
+            svc.run(request_id="req-fp-2", content="print(1)")
+
+        assert generate.call_count == 2
+        assert [e.request_id for e in ledger.read_telemetry()] == ["req-fp-1", "req-fp-2"]
+        assert [e.request_id for e in ledger.read_behavioral()] == ["req-fp-1"]
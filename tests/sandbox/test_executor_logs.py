@@ -1,6 +1,23 @@
 from __future__ import annotations
 
-from dhi.sandbox.executor import _decode_stream, _summarize_capped_stream
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import docker  # type: ignore[import-untyped]
+import docker.errors  # type: ignore[import-untyped]
+import pytest
+
+from dhi.sandbox import executor
+from dhi.sandbox.executor import (
+    _BALANCED_LOG_CAP,
+    _decode_stream,
+    _read_log_stream,
+    _summarize_capped_stream,
+)
+from dhi.sandbox.models import ViolationEvent
+
+_ConnectionError = docker.errors.requests.exceptions.ConnectionError
 
 
 def test_decode_stream_returns_utf8_prefix() -> None:
@@ -13,5 +30,122 @@ def test_summarize_capped_stream_adds_metadata_marker() -> None:
     raw = ("b" * (20 * 1024)).encode("utf-8")
     summary = _summarize_capped_stream(raw, stream_name="stdout")
     assert "[TRUNCATED_STDOUT" in summary
-    assert "original_bytes=" in summary
+    assert f"original_bytes_min={len(raw)}" in summary
     assert "preview_bytes=" in summary
+
+
+class _FakeContainer:
+    def __init__(self, stdout_chunks: list[bytes], stderr_chunks: list[bytes]) -> None:
+        self._chunks = {True: stdout_chunks, False: stderr_chunks}
+        self.chunks_read = 0
+        self.closed = False
+
+    def logs(self, *, stdout: bool, stderr: bool, stream: bool, follow: bool) -> Iterator[bytes]:
+        assert stream is True and follow is False and stderr is not stdout
+        return self._stream(self._chunks[stdout])
+
+    def _stream(self, chunks: list[bytes]) -> Iterator[bytes]:
+        try:
+            for chunk in chunks:
+                self.chunks_read += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def test_read_log_stream_keeps_small_output_whole() -> None:
+    container = _FakeContainer([b"hello ", b"world"], [b"oops"])
+    assert _read_log_stream(container, stdout=True) == b"hello world"
+    assert _read_log_stream(container, stdout=False) == b"oops"
+    assert container.closed
+
+
+def test_read_log_stream_stops_pulling_once_capped() -> None:
+    chunk = b"x" * (1024 * 1024)
+    container = _FakeContainer([chunk] * 1000, [])
+    kept = _read_log_stream(container, stdout=True)
+    assert len(kept) == _BALANCED_LOG_CAP + 1
+    assert container.chunks_read == _BALANCED_LOG_CAP // len(chunk) + 1
+    assert container.closed
+
+
+def test_summarize_capped_stream_reports_size_as_lower_bound() -> None:
+    raw = b"y" * (_BALANCED_LOG_CAP + 1)
+    summary = _summarize_capped_stream(raw, stream_name="stderr")
+    assert f"original_bytes_min={_BALANCED_LOG_CAP + 1} " in summary
+
+
+def test_docker_client_is_reused_between_runs() -> None:
+    with (
+        patch.object(executor, "_docker_client", None),
+        patch("dhi.sandbox.executor.docker.from_env") as from_env,
+    ):
+        first = executor._get_docker_client()
+        second = executor._get_docker_client()
+
+    assert first is second
+    from_env.assert_called_once()
+    from_env.return_value.ping.assert_called_once()
+
+
+def test_docker_client_dropped_when_ping_fails() -> None:
+    stale = MagicMock()
+    stale.ping.side_effect = docker.errors.DockerException("daemon gone")
+    with (
+        patch.object(executor, "_docker_client", stale),
+        patch.object(executor, "_docker_last_ping", 0.0),
+        patch("dhi.sandbox.executor.time.monotonic", return_value=1e9),
+    ):
+        with pytest.raises(docker.errors.DockerException):
+            executor._get_docker_client()
+        assert executor._docker_client is None
+
+
+def test_docker_client_dropped_when_daemon_connection_fails_on_ping() -> None:
+    stale = MagicMock()
+    stale.ping.side_effect = _ConnectionError("connection refused")
+    with (
+        patch.object(executor, "_docker_client", stale),
+        patch.object(executor, "_docker_last_ping", 0.0),
+        patch("dhi.sandbox.executor.time.monotonic", return_value=1e9),
+    ):
+        result = executor.run_in_sandbox("print('hi')", request_id="req-down", attempt=1)
+        assert executor._docker_client is None
+
+    assert result.status == "fail"
+    assert result.terminal_event == ViolationEvent.StrictModeUnavailable
+    assert "Docker daemon unavailable" in result.stderr
+
+
+def test_docker_client_dropped_when_daemon_goes_down_between_pings() -> None:
+    cached = MagicMock()
+    cached.containers.run.side_effect = _ConnectionError("connection refused")
+    with (
+        patch.object(executor, "_docker_client", cached),
+        patch.object(executor, "_docker_last_ping", time.monotonic()),
+    ):
+        result = executor.run_in_sandbox("print('hi')", request_id="req-down", attempt=1)
+        assert executor._docker_client is None
+
+    cached.ping.assert_not_called()
+    assert result.status == "fail"
+    assert result.terminal_event == ViolationEvent.StrictModeUnavailable
+    assert "Docker daemon unavailable" in result.stderr
+
+
+def test_log_read_connection_error_keeps_exit_code_and_client() -> None:
+    cached = MagicMock()
+    container = cached.containers.run.return_value
+    container.wait.return_value = {"StatusCode": 3}
+    container.logs.side_effect = _ConnectionError("connection reset")
+    with (
+        patch.object(executor, "_docker_client", cached),
+        patch.object(executor, "_docker_last_ping", time.monotonic()),
+    ):
+        result = executor.run_in_sandbox("print('hi')", request_id="req-logs", attempt=1)
+        assert executor._docker_client is cached
+
+    assert result.exit_code == 3
+    assert result.stderr == "Failed to retrieve container logs."
+    assert result.terminal_event != ViolationEvent.StrictModeUnavailable
+    container.remove.assert_called_once_with(force=True)
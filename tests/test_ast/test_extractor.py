@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from dhi.ast_ext.extractor import ASTExtractor
+from dhi.ast_ext.parser import parse_source
+from dhi.ast_ext.slicer import ContextSlicer
 
 FIXTURE_SOURCE = """\
 def add(a: int, b: int) -> int:
@@ -126,3 +131,95 @@ def test_extract_file_reads_path(extractor: ASTExtractor, tmp_path: Path) -> Non
 def test_extract_file_raises_for_missing(extractor: ASTExtractor) -> None:
     with pytest.raises(FileNotFoundError):
         extractor.extract_file("/does/not/exist.py")
+
+
+def test_extracts_call_edges_from_methods(extractor: ASTExtractor) -> None:
+    _, edges = extractor.extract(FIXTURE_SOURCE)
+    assert any(edge.caller == "run" and edge.callee == "compute" for edge in edges)
+
+
+def test_extract_memoizes_identical_source(extractor: ASTExtractor) -> None:
+    source = FIXTURE_SOURCE + "\n\ndef memo_probe() -> None:\n    add(1, 2)\n"
+    with patch("dhi.ast_ext.extractor.parse_source", wraps=parse_source) as mock_parse:
+        first = extractor.extract(source)
+        second = extractor.extract(source)
+
+    assert mock_parse.call_count == 1
+    assert first == second
+
+
+def test_extract_file_picks_up_modified_file(extractor: ASTExtractor, tmp_path: Path) -> None:
+    path = tmp_path / "changing.py"
+    path.write_text("def before() -> None:\n    pass\n", encoding="utf-8")
+    symbols, _ = extractor.extract_file(path)
+    assert [symbol.name for symbol in symbols] == ["before"]
+
+    path.write_text("def after_change() -> None:\n    pass\n", encoding="utf-8")
+    symbols, _ = extractor.extract_file(path)
+    assert [symbol.name for symbol in symbols] == ["after_change"]
+
+
+def test_index_exposes_symbol_map_and_callees(extractor: ASTExtractor) -> None:
+    index = extractor.index(FIXTURE_SOURCE)
+    assert set(index.symbol_map) == {symbol.name for symbol in index.symbols}
+    assert set(index.callees_by_caller["compute"]) == {"add", "multiply"}
+    assert "add" not in index.callees_by_caller
+
+
+def test_index_for_target_limits_edges_to_target(extractor: ASTExtractor) -> None:
+    index = extractor.index_for_target(FIXTURE_SOURCE, "compute")
+    assert {symbol.name for symbol in index.symbols} == {
+        symbol.name for symbol in extractor.index(FIXTURE_SOURCE).symbols
+    }
+    assert {edge.caller for edge in index.edges} == {"compute"}
+    assert set(index.callees_by_caller["compute"]) == {"add", "multiply"}
+
+
+def test_attribute_call_resolves_left_most_identifier(extractor: ASTExtractor) -> None:
+    source = """\
+def registry() -> None:
+    pass
+
+
+def method() -> None:
+    pass
+
+
+def caller() -> None:
+    registry.entries.method()
+"""
+    _, edges = extractor.extract(source)
+    callees = {edge.callee for edge in edges if edge.caller == "caller"}
+    assert callees == {"registry"}
+
+
+def test_symbols_are_returned_in_source_order(extractor: ASTExtractor) -> None:
+    symbols, _ = extractor.extract(FIXTURE_SOURCE)
+    start_lines = [symbol.start_line for symbol in symbols]
+    assert start_lines == sorted(start_lines)
+
+
+def test_extract_and_slice_are_consistent_across_threads(extractor: ASTExtractor) -> None:
+    helpers = "".join(
+        f"def helper_{i}(x: int) -> int:\n    return helper_{i + 1}(x) + {i}\n\n\n"
+        for i in range(200)
+    )
+    source = helpers + "def helper_200(x: int) -> int:\n    return x\n"
+    slicer = ContextSlicer()
+    workers = 8
+    barrier = threading.Barrier(workers)
+
+    def run(worker: int) -> tuple[int, int, str]:
+        barrier.wait(timeout=5)
+        symbols, edges = extractor.extract(source)
+        sliced = slicer.slice_source(source, f"helper_{worker * 20}")
+        return len(symbols), len(edges), sliced.slice_source
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run, range(workers)))
+
+    for worker, (symbol_count, edge_count, content) in enumerate(results):
+        assert symbol_count == 201
+        assert edge_count == 200
+        assert f"def helper_{worker * 20}(" in content
+        assert f"def helper_{worker * 20 + 1}(" in content
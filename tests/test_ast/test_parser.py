@@ -73,3 +73,18 @@ def test_language_loads_only_once() -> None:
     lang1 = _get_python_language()
     lang2 = _get_python_language()
     assert lang1 is lang2
+
+
+def test_parser_is_reused_within_thread() -> None:
+    """Repeated parses on one thread share a single Parser instance."""
+    from dhi.ast_ext.parser import _get_parser
+
+    assert _get_parser() is _get_parser()
+
+
+def test_parse_source_accepts_bytes() -> None:
+    from dhi.ast_ext.parser import parse_source
+
+    from_bytes = parse_source(SIMPLE_PYTHON.encode("utf-8"))
+    from_str = parse_source(SIMPLE_PYTHON)
+    assert str(from_bytes.root_node) == str(from_str.root_node)
@@ -132,3 +132,13 @@ class TestFileBased:
         result = slicer.slice(SliceRequest(file_path=str(path), target_line=999))
         assert not result.found
         assert result.error is not None
+
+
+class TestSliceRequestValidation:
+    def test_requires_target_or_line(self) -> None:
+        with pytest.raises(ValueError, match="target"):
+            SliceRequest(file_path="/tmp/example.py")
+
+    def test_rejects_non_positive_line(self) -> None:
+        with pytest.raises(ValueError, match="target_line"):
+            SliceRequest(file_path="/tmp/example.py", target_line=0)
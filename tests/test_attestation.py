@@ -4,6 +4,7 @@ Covers:
   - AttestationManifest builder correctness
   - VerificationTier mapping (L0 / L1 / L2 / AI_TESTS_ONLY)
   - assert_manifest_complete guard (blocks unverified label)
+  - ManifestStore bounded eviction
   - Mandatory acceptance scenarios from architecture docs
 """
 
@@ -14,6 +15,7 @@ import pytest
 from dhi.attestation.manifest import (
     AttestationManifest,
     ManifestIncompleteError,
+    ManifestStore,
     assert_manifest_complete,
     build_manifest,
 )
@@ -212,6 +214,34 @@ def test_assert_manifest_complete_raises_for_empty_request_id() -> None:
         assert_manifest_complete(bad_manifest)
 
 
+# ---------------------------------------------------------------------------
+# Manifest store
+# ---------------------------------------------------------------------------
+
+
+def test_manifest_store_evicts_least_recently_used() -> None:
+    store = ManifestStore(maxsize=2)
+    manifests = {
+        request_id: build_manifest(result=_make_result(request_id=request_id))
+        for request_id in ("req-a", "req-b", "req-c")
+    }
+    store.put("req-a", manifests["req-a"])
+    store.put("req-b", manifests["req-b"])
+    # Reading req-a makes req-b the eviction candidate.
+    assert store.get("req-a") is manifests["req-a"]
+    store.put("req-c", manifests["req-c"])
+
+    assert len(store) == 2
+    assert store.get("req-b") is None
+    assert store.get("req-a") is manifests["req-a"]
+    assert store.get("req-c") is manifests["req-c"]
+
+
+def test_manifest_store_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError, match="maxsize"):
+        ManifestStore(maxsize=0)
+
+
 # ---------------------------------------------------------------------------
 # Mandatory acceptance scenarios (from docs/15_Team_and_Execution_Plan.md §8)
 # ---------------------------------------------------------------------------
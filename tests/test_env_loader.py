@@ -32,3 +32,38 @@ def test_load_dotenv_does_not_override_existing(
 
     env_module.load_dotenv()
     assert os.getenv("NVIDIA_API_KEY") == "existing-key"
+
+
+def test_load_dotenv_override_rereads_changed_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("NVIDIA_API_KEY=first-key\n", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("NVIDIA_API_KEY", raising=False)
+    monkeypatch.setattr(env_module, "_ENV_LOADED", False)
+
+    env_module.load_dotenv()
+    assert os.getenv("NVIDIA_API_KEY") == "first-key"
+
+    env_file.write_text("NVIDIA_API_KEY=second-key-longer\n", encoding="utf-8")
+    env_module.load_dotenv(override=True)
+    assert os.getenv("NVIDIA_API_KEY") == "second-key-longer"
+
+
+def test_positive_int_env_parses_or_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DHI_TEST_WORKERS", raising=False)
+    assert env_module.positive_int_env("DHI_TEST_WORKERS", 8) == 8
+
+    monkeypatch.setenv("DHI_TEST_WORKERS", "3")
+    assert env_module.positive_int_env("DHI_TEST_WORKERS", 8) == 3
+
+
+@pytest.mark.parametrize("raw", ["0", "-2", "four", ""])
+def test_positive_int_env_rejects_invalid_values(
+    monkeypatch: pytest.MonkeyPatch, raw: str
+) -> None:
+    monkeypatch.setenv("DHI_TEST_WORKERS", raw)
+    with pytest.raises(ValueError, match="DHI_TEST_WORKERS"):
+        env_module.positive_int_env("DHI_TEST_WORKERS", 8)
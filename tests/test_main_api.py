@@ -1,6 +1,9 @@
 ﻿from __future__ import annotations
 
+import inspect
+import time
 from datetime import datetime, timezone
+from typing import Any
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
@@ -9,6 +12,7 @@ import dhi.main as main_module
 from dhi.interceptor.models import GovernanceAuditRecord
 from dhi.interceptor.service import InterceptorResponse, InterceptorService
 from dhi.main import app
+from dhi.orchestrator.jobs import JobQueueFullError
 from dhi.orchestrator.models import OrchestrationResult
 from dhi.sandbox.models import VerificationMode, VerificationResult, VerificationTier
 
@@ -54,6 +58,12 @@ def test_verify_endpoint_uses_sandbox_executor() -> None:
     mock_run.assert_called_once()
 
 
+def test_blocking_endpoints_run_in_threadpool() -> None:
+    # Plain def handlers are dispatched to the threadpool, keeping the event loop free.
+    for endpoint in (main_module.verify, main_module.intercept, main_module.orchestrate):
+        assert not inspect.iscoroutinefunction(endpoint)
+
+
 def test_intercept_endpoint_uses_interceptor_service() -> None:
     audit = GovernanceAuditRecord(
         request_id="intercept-1",
@@ -208,6 +218,48 @@ def test_orchestrate_endpoint_uses_orchestrator_service() -> None:
     assert kwargs["mode"] == VerificationMode.balanced
 
 
+def _poll_orchestration(job_id: str) -> dict[str, Any]:
+    deadline = time.monotonic() + 5
+    while True:
+        response = client.get(f"/orchestrate/result/{job_id}")
+        assert response.status_code == 200
+        body: dict[str, Any] = response.json()
+        if body["status"] != "pending":
+            return body
+        assert time.monotonic() < deadline, f"job {job_id} did not finish"
+        time.sleep(0.01)
+
+
+def test_orchestrate_submit_returns_job_that_can_be_polled() -> None:
+    fake_response = OrchestrationResult(
+        request_id="orch-job",
+        attempt_count=1,
+        retry_count=0,
+        final_status="pass",
+        terminal_event=None,
+        attempts=[],
+    )
+
+    with patch("dhi.main.OrchestratorService") as mock_service_cls:
+        mock_service_cls.return_value.run.return_value = fake_response
+        submitted = client.post(
+            "/orchestrate/submit",
+            json={"request_id": "orch-job", "content": "Fix this function"},
+        )
+        assert submitted.status_code == 200
+        job_id = submitted.json()["job_id"]
+        body = _poll_orchestration(job_id)
+
+    assert body["status"] == "completed"
+    assert body["result"]["request_id"] == "orch-job"
+    assert mock_service_cls.return_value.run.call_args.kwargs["request_id"] == "orch-job"
+
+
+def test_orchestrate_result_unknown_job_returns_404() -> None:
+    response = client.get("/orchestrate/result/does-not-exist")
+    assert response.status_code == 404
+
+
 def test_intercept_endpoint_handles_gateway_failure() -> None:
     with patch("dhi.interceptor.gateway.completion", side_effect=Exception("api down")):
         response = client.post(
@@ -302,3 +354,40 @@ def test_orchestrate_endpoint_rejects_invalid_llm_provider() -> None:
         },
     )
     assert response.status_code == 422
+
+
+def test_orchestrate_submit_returns_503_when_queue_full() -> None:
+    with patch.object(
+        main_module._ORCHESTRATION_JOBS,
+        "submit",
+        side_effect=JobQueueFullError("16 orchestration jobs already pending"),
+    ):
+        response = client.post(
+            "/orchestrate/submit",
+            json={"request_id": "orch-busy", "content": "Fix this function"},
+        )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+
+
+def test_orchestrate_submit_works_across_lifespan_cycles() -> None:
+    fake_response = OrchestrationResult(
+        request_id="orch-cycle",
+        attempt_count=1,
+        retry_count=0,
+        final_status="pass",
+        terminal_event=None,
+        attempts=[],
+    )
+
+    with patch("dhi.main.OrchestratorService") as mock_service_cls:
+        mock_service_cls.return_value.run.return_value = fake_response
+        for _ in range(2):
+            with TestClient(app) as cycle_client:
+                submitted = cycle_client.post(
+                    "/orchestrate/submit",
+                    json={"request_id": "orch-cycle", "content": "Fix this function"},
+                )
+                assert submitted.status_code == 200
+                assert _poll_orchestration(submitted.json()["job_id"])["status"] == "completed"
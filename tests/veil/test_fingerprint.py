@@ -1,8 +1,10 @@
 """Tests for the VEIL Environment Fingerprint Generator."""
 
+import hashlib
 import sys
+from pathlib import Path
 
-from dhi.veil.fingerprint import EnvironmentFingerprint
+from dhi.veil.fingerprint import EnvironmentFingerprint, _sha256_file
 
 
 def test_fingerprint_generation() -> None:
@@ -41,3 +43,15 @@ def test_fingerprint_inequality() -> None:
     )
 
     assert fp1 != fp2
+
+
+def test_sha256_file_rehashes_changed_file(tmp_path: Path) -> None:
+    """Cached file digests are invalidated when the file changes."""
+    target = tmp_path / "uv.lock"
+    target.write_bytes(b"first")
+    assert _sha256_file(target) == hashlib.sha256(b"first").hexdigest()
+
+    target.write_bytes(b"second version")
+    assert _sha256_file(target) == hashlib.sha256(b"second version").hexdigest()
+    assert _sha256_file(tmp_path / "missing.lock") == ""
+    assert _sha256_file(tmp_path) == ""
@@ -1,7 +1,11 @@
 """Tests for the VEIL In-Process Ledger."""
 
+import io
+import json
 from datetime import datetime, timezone
 
+import pytest
+
 from dhi.orchestrator.models import AttemptRecord, OrchestrationResult
 from dhi.sandbox.models import FailureClass, VerificationMode, VerificationResult, VerificationTier
 from dhi.veil.fingerprint import EnvironmentFingerprint
@@ -87,3 +91,83 @@ def test_ledger_gate_fail() -> None:
     
     assert telemetry[0].outcome == "fail"
     assert telemetry[0].failure_class == FailureClass.flake
+
+
+def test_ledger_drops_oldest_events_when_bounded() -> None:
+    """A bounded ledger keeps only the most recent events per stream."""
+    ledger = VeilLedger(max_events=2)
+    gate = DeterminismGate()
+    fp = EnvironmentFingerprint.generate()
+
+    for request_id in ("req-a", "req-b", "req-c"):
+        result = _mock_orchestration(final_status="pass").model_copy(
+            update={"request_id": request_id}
+        )
+        decision = gate.evaluate(result, fingerprint=fp, baseline=fp)
+        ledger.write(decision=decision, result=result, fingerprint=fp)
+
+    assert [e.request_id for e in ledger.read_telemetry()] == ["req-b", "req-c"]
+    assert [e.request_id for e in ledger.read_behavioral()] == ["req-b", "req-c"]
+
+
+def test_ledger_rejects_non_positive_bound() -> None:
+    with pytest.raises(ValueError):
+        VeilLedger(max_events=0)
+
+
+def test_ledger_dumps_streams_as_json_arrays() -> None:
+    """Batch JSON export matches per-event serialization."""
+    ledger = VeilLedger()
+    gate = DeterminismGate()
+    fp = EnvironmentFingerprint.generate()
+
+    result = _mock_orchestration(final_status="pass")
+    decision = gate.evaluate(result, fingerprint=fp, baseline=fp)
+    ledger.write(decision=decision, result=result, fingerprint=fp)
+
+    telemetry = json.loads(ledger.dump_telemetry_json())
+    behavioral = json.loads(ledger.dump_behavioral_json())
+
+    assert telemetry == [json.loads(e.model_dump_json()) for e in ledger.read_telemetry()]
+    assert behavioral == [json.loads(e.model_dump_json()) for e in ledger.read_behavioral()]
+    assert telemetry[0]["event_type"] == "telemetry"
+    assert behavioral[0]["fingerprint"]["python_version"] == fp.python_version
+
+
+def test_ledger_flushes_behavioral_events_as_jsonl() -> None:
+    """Each behavioral event is written as one JSON line."""
+    ledger = VeilLedger()
+    gate = DeterminismGate()
+    fp = EnvironmentFingerprint.generate()
+
+    for request_id in ("req-a", "req-b"):
+        result = _mock_orchestration(final_status="pass").model_copy(
+            update={"request_id": request_id}
+        )
+        decision = gate.evaluate(result, fingerprint=fp, baseline=fp)
+        ledger.write(decision=decision, result=result, fingerprint=fp)
+
+    buffer = io.BytesIO()
+    written = ledger.flush_jsonl(buffer)
+
+    lines = buffer.getvalue().splitlines()
+    assert written == 2
+    assert [json.loads(line)["request_id"] for line in lines] == ["req-a", "req-b"]
+    assert len(ledger.read_behavioral()) == 2
+
+
+def test_ledger_interns_outcome() -> None:
+    """Outcomes of deserialized results share one interned string."""
+    ledger = VeilLedger()
+    gate = DeterminismGate()
+    fp = EnvironmentFingerprint.generate()
+
+    for _ in range(2):
+        result = OrchestrationResult.model_validate_json(
+            _mock_orchestration(final_status="pass").model_dump_json()
+        )
+        decision = gate.evaluate(result, fingerprint=fp, baseline=fp)
+        ledger.write(decision=decision, result=result, fingerprint=fp)
+
+    first, second = ledger.read_telemetry()
+    assert first.outcome is second.outcome
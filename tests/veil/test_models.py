@@ -72,3 +72,21 @@ def test_gate_decision() -> None:
     assert not decision.passed
     assert decision.reason == "noise:flake"
     assert not decision.reproducible
+
+
+def test_events_are_frozen() -> None:
+    """Recorded events and gate decisions reject attribute assignment."""
+    event = TelemetryEvent(
+        request_id="req-frozen",
+        timestamp=datetime.now(timezone.utc),
+        outcome="pass",
+        failure_class=None,
+        attempt_count=1,
+        duration_ms=10,
+    )
+    decision = GateDecision(passed=True, reason="ok", reproducible=True)
+
+    with pytest.raises(ValidationError):
+        event.outcome = "fail"
+    with pytest.raises(ValidationError):
+        decision.passed = False